@@ -9,6 +9,8 @@
  */
 
 require('dotenv').config();
+const fs = require('fs');
+const readline = require('readline');
 const { Pinecone } = require('@pinecone-database/pinecone');
 const OpenAI = require('openai');
 
@@ -110,6 +112,32 @@ function initializePinecone() {
   });
 }
 
+/**
+ * Stream knowledge chunks one at a time.
+ *
+ * Reads newline-delimited JSON exported from data_chunks.py
+ * (`python chunk_stream.py export --output chunks.jsonl`) when a path is
+ * given, otherwise falls back to the built-in gsuKnowledgeChunks list.
+ * @param {string} [chunksPath] - Path to an NDJSON chunk export
+ */
+async function* readChunks(chunksPath) {
+  if (!chunksPath) {
+    yield* gsuKnowledgeChunks;
+    return;
+  }
+
+  const lines = readline.createInterface({
+    input: fs.createReadStream(chunksPath, { encoding: 'utf8' }),
+    crlfDelay: Infinity,
+  });
+
+  for await (const line of lines) {
+    if (line.trim()) {
+      yield JSON.parse(line);
+    }
+  }
+}
+
 /**
  * Get embedding for text using OpenAI
  */
@@ -129,8 +157,9 @@ async function getEmbedding(text, openaiClient) {
 
 /**
  * Upload knowledge chunks to Pinecone
+ * @param {string} [chunksPath] - NDJSON chunk export; defaults to CHUNKS_JSONL
  */
-async function uploadChunksToPinecone() {
+async function uploadChunksToPinecone(chunksPath = process.env.CHUNKS_JSONL) {
   try {
     console.log('🚀 Starting Pinecone upload process...');
 
@@ -164,11 +193,13 @@ async function uploadChunksToPinecone() {
     // Connect to the index
     const index = pineconeClient.index(indexName);
 
-    // Prepare vectors for upload
-    console.log('🔄 Generating embeddings and preparing vectors...');
-    const vectors = [];
+    // Embed and upload chunks as they stream in, one upsert batch at a time
+    console.log(`🔄 Generating embeddings from ${chunksPath || 'built-in chunks'}...`);
+    const batchSize = 100;
+    let vectors = [];
+    let uploaded = 0;
 
-    for (const chunk of gsuKnowledgeChunks) {
+    for await (const chunk of readChunks(chunksPath)) {
       console.log(`   Processing: ${chunk.id}`);
       const embedding = await getEmbedding(chunk.text, openaiClient);
       
@@ -181,13 +212,22 @@ async function uploadChunksToPinecone() {
           topic: chunk.metadata.topic
         }
       });
+
+      if (vectors.length >= batchSize) {
+        console.log('📤 Uploading vectors to Pinecone...');
+        await index.upsert(vectors);
+        uploaded += vectors.length;
+        vectors = [];
+      }
     }
 
-    // Upload vectors to Pinecone
-    console.log('📤 Uploading vectors to Pinecone...');
-    await index.upsert(vectors);
+    if (vectors.length > 0) {
+      console.log('📤 Uploading vectors to Pinecone...');
+      await index.upsert(vectors);
+      uploaded += vectors.length;
+    }
 
-    console.log(`✅ Successfully uploaded ${vectors.length} knowledge chunks to Pinecone!`);
+    console.log(`✅ Successfully uploaded ${uploaded} knowledge chunks to Pinecone!`);
     console.log('🎉 GSU Chatbot knowledge base is now ready!');
 
   } catch (error) {
@@ -232,7 +272,7 @@ async function testPineconeQuery() {
 
 // Main execution
 if (require.main === module) {
-  uploadChunksToPinecone()
+  uploadChunksToPinecone(process.argv[2] || process.env.CHUNKS_JSONL)
     .then(() => testPineconeQuery())
     .then(() => {
       console.log('\n🎯 Upload process completed successfully!');
@@ -247,5 +287,6 @@ if (require.main === module) {
 module.exports = {
   uploadChunksToPinecone,
   testPineconeQuery,
+  readChunks,
   gsuKnowledgeChunks
 };
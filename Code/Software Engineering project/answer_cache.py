@@ -0,0 +1,203 @@
+# answer_cache.py
+
+"""Semantic cache of final answers, keyed by query embedding similarity.
+
+Students ask the same questions in slightly different words. ``AnswerCache``
+keeps the normalized query embedding, the ids of the chunks the answer was
+built from and the answer itself; ``lookup`` returns a cached answer when a
+new query's embedding is within ``threshold`` cosine similarity of a stored
+one, skipping both retrieval and the completion.
+
+Entries expire after ``ttl`` seconds and the least recently used entry is
+evicted beyond ``max_entries``. Each entry also records the content hash
+(``embedding_cache.chunk_key``) of every chunk it references; an entry whose
+chunks changed or disappeared since it was stored is dropped instead of
+served. ``lookup`` re-checks a digest of the whole corpus (at most every
+``check_interval`` seconds) and re-hashes the chunks when it changed, so a
+reloaded data_chunks.py or a rebuilt artifact invalidates stale answers
+without a manual ``refresh``.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import data_chunks
+from embedding_cache import chunk_key
+from instrumentation import count
+from vector_index import normalize_vector
+
+
+class _Entry:
+    __slots__ = ("vector", "chunk_ids", "fingerprints", "answer", "created")
+
+    def __init__(self, vector, chunk_ids, fingerprints, answer, created):
+        self.vector = vector
+        self.chunk_ids = chunk_ids
+        self.fingerprints = fingerprints
+        self.answer = answer
+        self.created = created
+
+
+def _published_chunks():
+    # Looked up on every call so that importlib.reload(data_chunks) is seen.
+    return data_chunks.all_chunks
+
+
+def corpus_digest(chunks):
+    """Digest of the ids and texts of ``chunks``; a ``CorpusArtifact`` reports its own."""
+    digest = getattr(chunks, "digest", None)
+    if digest is not None:
+        return digest
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        for part in (chunk["id"], chunk["text"]):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """Thread-safe LRU + TTL cache of answers with similarity lookup.
+
+    ``chunks`` is the corpus whose content hashes entries are validated
+    against: a sequence of chunks, or a callable returning the current one.
+    It defaults to ``data_chunks.all_chunks``, looked up anew on every check.
+    ``check_interval`` is the minimum number of seconds between corpus digest
+    checks (0 checks on every lookup). ``clock`` returns seconds and defaults
+    to ``time.monotonic``.
+    """
+
+    def __init__(self, chunks=None, threshold=0.95, max_entries=1024, ttl=3600.0, check_interval=5.0,
+                 clock=time.monotonic):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._next_key = 0
+        self._matrix = None
+        self._matrix_keys = None
+        self._lock = threading.Lock()
+        self._fingerprints = {}
+        self._digest = None
+        self._checked = None
+        self.refresh(_published_chunks if chunks is None else chunks)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def refresh(self, chunks=None):
+        """Re-hash the corpus and drop every entry that references a changed chunk.
+
+        ``chunks`` replaces the corpus given to the constructor. Returns the
+        number of entries dropped.
+        """
+        with self._lock:
+            if chunks is not None:
+                self._source = chunks
+            return self._rehash(self._current_chunks())
+
+    def _current_chunks(self):
+        return self._source() if callable(self._source) else self._source
+
+    def _rehash(self, chunks, digest=None):
+        self._fingerprints = {chunk["id"]: chunk_key(chunk) for chunk in chunks}
+        self._digest = corpus_digest(chunks) if digest is None else digest
+        self._checked = self.clock()
+        stale = [key for key, entry in self._entries.items() if not self._is_current(entry)]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+
+    def _check_corpus(self, now):
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        chunks = self._current_chunks()
+        digest = corpus_digest(chunks)
+        if digest != self._digest:
+            self._rehash(chunks, digest)
+
+    def _is_current(self, entry):
+        return all(fingerprint is not None and self._fingerprints.get(chunk_id) == fingerprint
+                   for chunk_id, fingerprint in entry.fingerprints.items())
+
+    def _remove(self, key):
+        del self._entries[key]
+        self._matrix = None
+
+    def _expire(self, now):
+        expired = [key for key, entry in self._entries.items() if now - entry.created > self.ttl]
+        for key in expired:
+            self._remove(key)
+
+    def lookup(self, query_vector):
+        """Return ``{"answer", "chunk_ids", "similarity"}`` for a close enough query, else None."""
+        query = normalize_vector(query_vector)
+        with self._lock:
+            now = self.clock()
+            self._check_corpus(now)
+            self._expire(now)
+            while self._entries:
+                if self._matrix is None:
+                    self._matrix_keys = list(self._entries)
+                    self._matrix = np.stack([self._entries[key].vector for key in self._matrix_keys])
+                similarities = self._matrix @ query
+                best = int(np.argmax(similarities))
+                similarity = float(similarities[best])
+                if similarity < self.threshold:
+                    break
+                key = self._matrix_keys[best]
+                entry = self._entries[key]
+                if not self._is_current(entry):
+                    self._remove(key)
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                count("answer_cache.hits")
+                return {"answer": entry.answer, "chunk_ids": list(entry.chunk_ids), "similarity": similarity}
+            self.misses += 1
+            count("answer_cache.misses")
+            return None
+
+    def store(self, query_vector, chunk_ids, answer):
+        """Cache ``answer``, built from the chunks ``chunk_ids``, for ``query_vector``.
+
+        Raises KeyError if an id is not in the corpus, since such an entry
+        could never be invalidated.
+        """
+        chunk_ids = tuple(chunk_ids)
+        with self._lock:
+            now = self.clock()
+            self._check_corpus(now)
+            unknown = [chunk_id for chunk_id in chunk_ids if chunk_id not in self._fingerprints]
+            if unknown:
+                raise KeyError(f"chunk ids not in the corpus: {', '.join(unknown)}")
+            fingerprints = {chunk_id: self._fingerprints[chunk_id] for chunk_id in chunk_ids}
+            entry = _Entry(normalize_vector(query_vector), chunk_ids, fingerprints, answer, now)
+            self._entries[self._next_key] = entry
+            self._next_key += 1
+            self._matrix = None
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
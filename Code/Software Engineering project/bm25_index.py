@@ -0,0 +1,138 @@
+# bm25_index.py
+
+"""BM25 inverted index over chunk text for keyword and course-code queries.
+
+The tokenizer keeps subject+number course codes ("CSC 4330", "BIOL 2251K")
+as single terms so exact-code queries rank the chunks that mention them.
+Posting lists are stored CSR-style in flat NumPy arrays: one offsets array
+indexed by term id, and parallel arrays of chunk positions and term
+frequencies. Scoring a query is a handful of vectorised scatter-adds.
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+from course_codes import iter_course_codes
+from data_chunks import all_chunks
+from instrumentation import traced
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how i in is it its "
+    "me my of on or the their them there these they this to was what when where "
+    "which who will with you your".split()
+)
+
+
+def tokenize(text, subjects=None):
+    """Split ``text`` into BM25 terms.
+
+    Course codes become one upper-case term each; everything else is
+    lower-cased words with stopwords removed. ``subjects`` is forwarded to
+    ``iter_course_codes`` so queries can match codes case-insensitively.
+    """
+    terms = []
+    last = 0
+    for start, end, code in iter_course_codes(text, subjects):
+        if start >= last:
+            terms.extend(_words(text[last:start]))
+            last = end
+        terms.append(code)
+    terms.extend(_words(text[last:]))
+    return terms
+
+
+def _words(text):
+    return [word for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over the ``text`` field of a list of chunks."""
+
+    def __init__(self, chunks=None, k1=1.2, b=0.75):
+        chunks = list(all_chunks if chunks is None else chunks)
+        self.k1 = k1
+        self.b = b
+        self.ids = [chunk["id"] for chunk in chunks]
+        self.texts = [chunk["text"] for chunk in chunks]
+        self.sources = [chunk.get("metadata", {}).get("source", "") for chunk in chunks]
+        self.topics = [chunk.get("metadata", {}).get("topic", "") for chunk in chunks]
+
+        documents = [Counter(tokenize(text)) for text in self.texts]
+        self.subjects = frozenset(
+            term.split(" ", 1)[0] for counts in documents for term in counts if " " in term
+        )
+
+        postings = {}
+        for position, counts in enumerate(documents):
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((position, tf))
+
+        self.vocabulary = {term: term_id for term_id, term in enumerate(sorted(postings))}
+        offsets = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        for term, term_id in self.vocabulary.items():
+            offsets[term_id + 1] = len(postings[term])
+        np.cumsum(offsets, out=offsets)
+
+        self.offsets = offsets
+        self.doc_ids = np.empty(offsets[-1], dtype=np.int32)
+        self.term_freqs = np.empty(offsets[-1], dtype=np.float32)
+        for term, term_id in self.vocabulary.items():
+            start, end = offsets[term_id], offsets[term_id + 1]
+            entries = postings[term]
+            self.doc_ids[start:end] = [position for position, _ in entries]
+            self.term_freqs[start:end] = [tf for _, tf in entries]
+
+        self.doc_lengths = np.array([sum(counts.values()) for counts in documents], dtype=np.float32)
+        n_docs = len(documents)
+        avg_length = float(self.doc_lengths.mean()) if n_docs else 0.0
+        # Per-document length normalisation is fixed at build time.
+        self._norm = self.k1 * (1 - self.b + self.b * self.doc_lengths / (avg_length or 1.0))
+        df = np.diff(offsets).astype(np.float64)
+        self.idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def query_terms(self, query):
+        """Tokenize a user query, matching course codes in any letter case."""
+        return tokenize(query, self.subjects)
+
+    def scores(self, query):
+        """BM25 score of every chunk for ``query`` as a float32 array."""
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for term, qtf in Counter(self.query_terms(query)).items():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end]
+            contribution = self.idf[term_id] * tf * (self.k1 + 1) / (tf + self._norm[docs])
+            # Each chunk appears once per posting list, so fancy-index add is safe.
+            scores[docs] += qtf * contribution
+        return scores
+
+    @traced("search.lexical")
+    def search(self, query, top_k=3):
+        """Return the ``top_k`` best-matching chunks with a positive score."""
+        scores = self.scores(query)
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size == 0:
+            return []
+        k = min(top_k, candidates.size)
+        best = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [
+            {
+                "id": self.ids[row],
+                "score": float(scores[row]),
+                "text": self.texts[row],
+                "source": self.sources[row],
+                "topic": self.topics[row],
+            }
+            for row in best
+        ]
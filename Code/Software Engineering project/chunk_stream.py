@@ -0,0 +1,132 @@
+# chunk_stream.py
+
+"""Streaming access to the corpus and NDJSON export.
+
+``iter_chunks`` yields chunks one at a time, optionally restricted to some
+chunk sets, topics or sources, so embedding and upload stages can run as a
+pipeline instead of holding ``all_chunks`` in memory. Chunk sets are built
+one after another as the iterator reaches them; reading from a compiled
+corpus artifact instead keeps memory constant regardless of corpus size.
+
+``python chunk_stream.py export --output chunks.jsonl`` writes the corpus as
+newline-delimited JSON, which Backend/scripts/uploadToPinecone.js can read
+instead of its own hard-coded copy of the chunks. The export strips citation
+markers (see citations.py) unless ``--raw`` is given; ``--dedupe`` collapses
+or links near-duplicates and ``--rechunk`` regroups chunks to a token range
+(see rechunker.py); both need the selected chunks in memory.
+"""
+
+import argparse
+import json
+import sys
+
+from citations import normalize_chunk
+from data_chunks import ALL_CHUNK_SETS, get_chunk_set
+from facet_index import value_set
+from instrumentation import dump, enable
+
+
+def iter_chunks(chunk_sets=None, topic=None, source=None, artifact=None, normalize=False):
+    """Yield chunks lazily, in corpus order.
+
+    ``chunk_sets`` names the sets to read (default: the published
+    ``ALL_CHUNK_SETS``); ``topic`` and ``source`` accept one value or a
+    collection. When ``artifact`` is a ``CorpusArtifact`` the chunks are
+    decoded from it one by one; the artifact does not record chunk sets, so
+    passing ``chunk_sets`` as well raises ValueError. ``normalize`` passes
+    each chunk through ``citations.normalize_chunk``.
+    """
+    if artifact is not None and chunk_sets is not None:
+        raise ValueError("chunk_sets cannot be combined with artifact; filter by topic or source instead")
+    return _iter_chunks(chunk_sets, topic, source, artifact, normalize)
+
+
+def _iter_chunks(chunk_sets, topic, source, artifact, normalize):
+    topics = value_set(topic)
+    sources = value_set(source)
+
+    def wanted(metadata):
+        return ((topics is None or metadata.get("topic") in topics)
+                and (sources is None or metadata.get("source") in sources))
+
+    if artifact is not None:
+        for position in range(len(artifact)):
+            if topics is not None and artifact.metadata_value(position, "topic") not in topics:
+                continue
+            if sources is not None and artifact.metadata_value(position, "source") not in sources:
+                continue
+            yield normalize_chunk(artifact[position])[0] if normalize else artifact[position]
+        return
+
+    if chunk_sets is None:
+        chunk_sets = ALL_CHUNK_SETS
+    elif isinstance(chunk_sets, str):
+        chunk_sets = [chunk_sets]
+    for name in chunk_sets:
+        for chunk in get_chunk_set(name):
+            if wanted(chunk.get("metadata", {})):
+                yield normalize_chunk(chunk)[0] if normalize else chunk
+
+
+def export_jsonl(chunks, output):
+    """Write ``chunks`` to the text stream ``output`` as NDJSON; returns the count."""
+    count = 0
+    for chunk in chunks:
+        output.write(json.dumps(chunk, ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export corpus chunks as newline-delimited JSON.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="write chunks as NDJSON")
+    export.add_argument("--output", default="-", help="output file, or - for stdout")
+    export.add_argument("--set", dest="chunk_sets", action="append",
+                        help="chunk set to export (repeatable; default: all published sets)")
+    export.add_argument("--topic", action="append", help="only chunks with this topic (repeatable)")
+    export.add_argument("--source", action="append", help="only chunks with this source (repeatable)")
+    export.add_argument("--artifact", help="read from a compiled corpus artifact instead")
+    export.add_argument("--raw", action="store_true", help="skip citation-marker normalization")
+    export.add_argument("--dedupe", choices=("collapse", "link"), help="handle near-duplicate chunks")
+    export.add_argument("--dedupe-threshold", type=float, default=0.7)
+    export.add_argument("--rechunk", action="store_true",
+                        help="merge tiny chunks and split oversized ones (see rechunker.py)")
+    export.add_argument("--trace", action="store_true", help="print a per-stage timing breakdown")
+    args = parser.parse_args()
+    if args.artifact and args.chunk_sets:
+        parser.error("--set cannot be combined with --artifact (artifacts do not record chunk sets)")
+    if args.trace:
+        enable()
+
+    artifact = None
+    if args.artifact:
+        from corpus_artifact import CorpusArtifact
+
+        artifact = CorpusArtifact(args.artifact)
+    try:
+        chunks = iter_chunks(args.chunk_sets, args.topic, args.source, artifact, normalize=not args.raw)
+        if args.dedupe:
+            from near_duplicates import dedupe
+
+            chunks = dedupe(chunks, args.dedupe, args.dedupe_threshold)
+        if args.rechunk:
+            from rechunker import rechunk
+
+            chunks = rechunk(chunks)
+        if args.output == "-":
+            count = export_jsonl(chunks, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8") as handle:
+                count = export_jsonl(chunks, handle)
+    finally:
+        if artifact is not None:
+            artifact.close()
+    print(f"Exported {count} chunks", file=sys.stderr)
+    if args.trace:
+        dump()
+
+
+if __name__ == "__main__":
+    main()
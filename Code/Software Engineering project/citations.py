@@ -0,0 +1,96 @@
+# citations.py
+
+"""Citation-marker normalization for the corpus build.
+
+Several chunk texts (the nursing and RN-BSN sets in particular) still carry
+extraction artifacts such as ``[cite: 1, 2]`` and ``[cite_start]``. They are
+embedded and sent to the LLM on every request without adding meaning.
+``normalize_chunk`` strips them from the text and records them as
+per-sentence provenance in ``metadata["citations"]``::
+
+    [{"sentence": 0, "cites": [2]}, {"sentence": 1, "cites": [1, 2]}, ...]
+
+where ``sentence`` indexes ``tokens.split_sentences(clean_text)``. Run
+``python citations.py`` for a per-chunk report of the tokens saved.
+"""
+
+import re
+
+from data_chunks import all_chunks
+from instrumentation import traced
+from tokens import count_tokens, split_sentences
+
+_CITE_RE = re.compile(r"\s*\[cite:\s*([\d,\s]+)\]")
+_CITE_START_RE = re.compile(r"\[cite_start\]\s*")
+
+
+def normalize_text(text):
+    """Return ``(clean_text, provenance)`` for one chunk text."""
+    text = _CITE_START_RE.sub("", text)
+    sentences, provenance = [], []
+    for sentence in split_sentences(text):
+        cites = []
+        for match in _CITE_RE.finditer(sentence):
+            cites.extend(int(n) for n in re.findall(r"\d+", match.group(1)))
+        clean = _CITE_RE.sub("", sentence).strip()
+        if not clean:
+            continue
+        if cites:
+            provenance.append({"sentence": len(sentences), "cites": sorted(set(cites))})
+        sentences.append(clean)
+    return " ".join(sentences), provenance
+
+
+@traced("normalize")
+def normalize_chunk(chunk):
+    """Return ``(normalized_chunk, report)``; the input chunk is not modified.
+
+    ``report`` holds ``id``, ``tokens_before``, ``tokens_after``, ``tokens_saved``
+    and ``markers`` (the number of citation markers removed).
+    """
+    original = chunk["text"]
+    markers = len(_CITE_RE.findall(original)) + len(_CITE_START_RE.findall(original))
+    text, provenance = (normalize_text(original) if markers else (original, []))
+
+    normalized = dict(chunk, text=text)
+    if provenance:
+        normalized["metadata"] = dict(chunk.get("metadata", {}), citations=provenance)
+
+    before = count_tokens(original)
+    after = count_tokens(text) if markers else before
+    report = {
+        "id": chunk["id"],
+        "tokens_before": before,
+        "tokens_after": after,
+        "tokens_saved": before - after,
+        "markers": markers,
+    }
+    return normalized, report
+
+
+def normalize_chunks(chunks, reports=None):
+    """Yield normalized chunks; append each chunk's report to ``reports`` if given."""
+    for chunk in chunks:
+        normalized, report = normalize_chunk(chunk)
+        if reports is not None:
+            reports.append(report)
+        yield normalized
+
+
+def main():
+    reports = []
+    for _ in normalize_chunks(all_chunks, reports):
+        pass
+    width = max((len(report["id"]) for report in reports), default=2)
+    print(f"{'id':<{width}}  markers  before  after  saved")
+    for report in reports:
+        if report["markers"]:
+            print(f"{report['id']:<{width}}  {report['markers']:>7}  {report['tokens_before']:>6}  "
+                  f"{report['tokens_after']:>5}  {report['tokens_saved']:>5}")
+    before = sum(report["tokens_before"] for report in reports)
+    saved = sum(report["tokens_saved"] for report in reports)
+    print(f"Total: {saved} of {before} tokens saved ({saved / before:.1%})" if before else "Empty corpus")
+
+
+if __name__ == "__main__":
+    main()
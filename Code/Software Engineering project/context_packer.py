@@ -0,0 +1,86 @@
+# context_packer.py
+
+"""Token-budget-aware packing of retrieved chunks into an LLM context block.
+
+``generateContextualResponse`` in pineconeClient.js joins whatever chunks
+come back, however long. ``ContextPacker`` instead walks the ranked chunks
+in order and greedily adds each one that still fits the token budget,
+skipping sentences that an earlier chunk already contributed. Sentence token
+counts are precomputed once per chunk, so packing does no tokenization on the
+query path for chunks that come from the corpus.
+"""
+
+import re
+
+from data_chunks import all_chunks
+from instrumentation import traced
+from tokens import count_tokens, split_sentences
+
+SEPARATOR = "\n\n"
+
+
+def _sentence_key(sentence):
+    return re.sub(r"\W+", " ", sentence.lower()).strip()
+
+
+def _analyze(text):
+    return tuple((sentence, _sentence_key(sentence), count_tokens(sentence))
+                 for sentence in split_sentences(text))
+
+
+class ContextPacker:
+    """Packs ranked chunks into a token budget.
+
+    ``chunks`` (default ``all_chunks``) are pre-analysed into sentences with
+    token counts, keyed by chunk id. Chunks passed to ``pack`` that were not
+    pre-analysed, or whose text differs, are analysed on the fly.
+    """
+
+    def __init__(self, chunks=None, separator=SEPARATOR):
+        chunks = all_chunks if chunks is None else chunks
+        self.separator = separator
+        self._separator_tokens = count_tokens(separator)
+        self._sentences = {}
+        for chunk in chunks:
+            self._sentences[chunk["id"]] = (chunk["text"], _analyze(chunk["text"]))
+
+    def token_count(self, chunk_id):
+        """Precomputed token count of a corpus chunk, or None if unknown."""
+        entry = self._sentences.get(chunk_id)
+        return sum(tokens for _, _, tokens in entry[1]) if entry else None
+
+    def _sentences_for(self, chunk):
+        entry = self._sentences.get(chunk["id"])
+        if entry is not None and entry[0] == chunk["text"]:
+            return entry[1]
+        return _analyze(chunk["text"])
+
+    @traced("pack")
+    def pack(self, ranked_chunks, budget):
+        """Greedily pack ``ranked_chunks`` (best first) into ``budget`` tokens.
+
+        Returns ``{"text", "ids", "tokens", "skipped"}``: the joined context
+        block, the ids it kept in order, the tokens it uses (an estimate
+        summed per sentence), and the ids that were dropped because they did
+        not fit or only repeated earlier sentences.
+        """
+        seen = set()
+        parts, ids, skipped = [], [], []
+        used = 0
+        for chunk in ranked_chunks:
+            kept = [(sentence, key, tokens) for sentence, key, tokens in self._sentences_for(chunk)
+                    if key not in seen]
+            if not kept:
+                skipped.append(chunk["id"])
+                continue
+            cost = sum(tokens for _, _, tokens in kept)
+            if parts:
+                cost += self._separator_tokens
+            if used + cost > budget:
+                skipped.append(chunk["id"])
+                continue
+            seen.update(key for _, key, _ in kept)
+            parts.append(" ".join(sentence for sentence, _, _ in kept))
+            ids.append(chunk["id"])
+            used += cost
+        return {"text": self.separator.join(parts), "ids": ids, "tokens": used, "skipped": skipped}
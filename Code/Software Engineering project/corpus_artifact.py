@@ -0,0 +1,312 @@
+# corpus_artifact.py
+
+"""Precompiled binary corpus artifact.
+
+``python corpus_artifact.py build`` compiles ``all_chunks`` into a single
+versioned file; ``CorpusArtifact`` memory-maps it and decodes chunks only
+when they are accessed, so consumers no longer have to import and execute
+data_chunks.py. Opening the artifact costs the same regardless of how many
+chunks it holds.
+
+Layout (little-endian, sections 8-byte aligned)::
+
+    header          magic, format version, chunk/column/string counts, SHA-256
+    string offsets  uint64[n_strings + 1] into the string blob
+    column names    uint32[n_columns] string indices
+    column kinds    uint32[n_columns], TEXT_COLUMN or JSON_COLUMN
+    columns         uint32[n_columns * n_chunks], column-major string indices
+                    (NO_VALUE where a chunk has no such metadata key)
+    string blob     UTF-8 bytes
+
+``CorpusArtifact.verify`` (``info --verify``) recomputes the SHA-256 of
+everything after the header and compares it with the recorded digest.
+
+Strings ``0..n-1`` are chunk ids and ``n..2n-1`` chunk texts; metadata values
+and column names are deduplicated after that. Metadata that is not a string
+(such as the ``citations`` provenance added by citations.py) is stored as
+JSON text in a JSON_COLUMN.
+
+``build`` runs the citation-normalization stage unless ``--raw`` is given,
+then can collapse or link near-duplicates with ``--dedupe`` and regroup
+chunks to a token range with ``--rechunk``, in the same order as
+``chunk_stream.py export``.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+
+from instrumentation import dump, enable, traced
+
+MAGIC = b"GSUCORP\0"
+FORMAT_VERSION = 2
+NO_VALUE = 0xFFFFFFFF
+TEXT_COLUMN = 0
+JSON_COLUMN = 1
+DEFAULT_ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_chunks.corpus")
+
+_HEADER = struct.Struct("<8sIIII32s")
+_HEADER_SIZE = 64
+
+if sys.byteorder != "little":  # pragma: no cover - memoryview.cast uses native order
+    raise ImportError("corpus_artifact requires a little-endian platform")
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+@traced("artifact.build")
+def build_artifact(chunks=None, path=DEFAULT_ARTIFACT_PATH, normalize=False):
+    """Compile ``chunks`` (default ``all_chunks``) into an artifact at ``path``.
+
+    With ``normalize`` the chunks first go through
+    ``citations.normalize_chunks``. Returns the hex digest recorded in the
+    header.
+    """
+    if chunks is None:
+        from data_chunks import all_chunks as chunks
+    if normalize:
+        from citations import normalize_chunks
+
+        chunks = normalize_chunks(chunks)
+    chunks = list(chunks)
+    n = len(chunks)
+
+    strings = [chunk["id"] for chunk in chunks] + [chunk["text"] for chunk in chunks]
+    interned = {}
+
+    def intern(value):
+        index = interned.get(value)
+        if index is None:
+            index = interned[value] = len(strings)
+            strings.append(value)
+        return index
+
+    column_names = []
+    for chunk in chunks:
+        for key in chunk.get("metadata", {}):
+            if key not in column_names:
+                column_names.append(key)
+    name_indices = [intern(name) for name in column_names]
+    kinds = []
+    columns = []
+    for name in column_names:
+        values = [chunk.get("metadata", {}).get(name) for chunk in chunks]
+        kind = TEXT_COLUMN if all(v is None or isinstance(v, str) for v in values) else JSON_COLUMN
+        kinds.append(kind)
+        for chunk, value in zip(chunks, values):
+            if name not in chunk.get("metadata", {}):
+                columns.append(NO_VALUE)
+            elif kind == JSON_COLUMN:
+                columns.append(intern(json.dumps(value, ensure_ascii=False, separators=(",", ":"))))
+            else:
+                columns.append(intern(value))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b"".join(encoded)
+
+    body = bytearray()
+    sections = (
+        struct.pack(f"<{len(offsets)}Q", *offsets),
+        struct.pack(f"<{len(name_indices)}I", *name_indices),
+        struct.pack(f"<{len(kinds)}I", *kinds),
+        struct.pack(f"<{len(columns)}I", *columns),
+        blob,
+    )
+    for section in sections:
+        body += section
+        body += b"\0" * (_align(len(body)) - len(body))
+
+    digest = hashlib.sha256(body).digest()
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, n, len(column_names), len(strings), digest)
+    header += b"\0" * (_HEADER_SIZE - len(header))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(header)
+        handle.write(body)
+    os.replace(tmp_path, path)
+    return digest.hex()
+
+
+class CorpusArtifact(Sequence):
+    """Read-only, memory-mapped view of a compiled corpus.
+
+    Indexing returns a chunk dict shaped like the entries of ``all_chunks``;
+    ``text``/``chunk_id``/``metadata_value`` decode a single field without
+    building the dict.
+    """
+
+    def __init__(self, path=DEFAULT_ARTIFACT_PATH):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        # Validate the header before exporting any memoryview: an mmap with
+        # live exports cannot be closed.
+        if len(self._mmap) < _HEADER_SIZE:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a corpus artifact")
+        magic, version, n, n_columns, n_strings, digest = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a corpus artifact")
+        if version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+
+        offsets_start = _HEADER_SIZE
+        names_start = _align(offsets_start + 8 * (n_strings + 1))
+        kinds_start = _align(names_start + 4 * n_columns)
+        columns_start = _align(kinds_start + 4 * n_columns)
+        blob_start = _align(columns_start + 4 * n_columns * n)
+        size = len(self._mmap)
+        if blob_start > size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated")
+        (blob_size,) = struct.unpack_from("<Q", self._mmap, offsets_start + 8 * n_strings)
+        if _align(blob_start + blob_size) != size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or has trailing data")
+
+        view = memoryview(self._mmap)
+        self.version = version
+        self.digest = digest.hex()
+        self._n = n
+        self._offsets = view[offsets_start:names_start].cast("Q")[:n_strings + 1]
+        names = view[names_start:kinds_start].cast("I")[:n_columns]
+        self._kinds = tuple(view[kinds_start:columns_start].cast("I")[:n_columns])
+        self._columns = view[columns_start:blob_start].cast("I")[:n_columns * n]
+        self._blob_start = blob_start
+        self._view = view
+        self.column_names = tuple(self._string(index) for index in names)
+        self._column_index = {name: i for i, name in enumerate(self.column_names)}
+        self._positions = None
+
+    def verify(self):
+        """True if the sections after the header match the SHA-256 in the header."""
+        return hashlib.sha256(self._view[_HEADER_SIZE:]).hexdigest() == self.digest
+
+    def close(self):
+        for name in ("_offsets", "_columns", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _string(self, index):
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return str(self._mmap[start:end], "utf-8")
+
+    def __len__(self):
+        return self._n
+
+    def chunk_id(self, position):
+        return self._string(position)
+
+    def text(self, position):
+        return self._string(self._n + position)
+
+    def metadata_value(self, position, name):
+        """One metadata field of the chunk at ``position``, or None if absent."""
+        column = self._column_index.get(name)
+        if column is None:
+            return None
+        index = self._columns[column * self._n + position]
+        if index == NO_VALUE:
+            return None
+        value = self._string(index)
+        return json.loads(value) if self._kinds[column] == JSON_COLUMN else value
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._n))]
+        if position < 0:
+            position += self._n
+        if not 0 <= position < self._n:
+            raise IndexError("chunk index out of range")
+        metadata = {}
+        for name in self.column_names:
+            value = self.metadata_value(position, name)
+            if value is not None:
+                metadata[name] = value
+        return {"id": self.chunk_id(position), "text": self.text(position), "metadata": metadata}
+
+    def position(self, chunk_id):
+        """Position of ``chunk_id``; the id table is decoded on first use."""
+        if self._positions is None:
+            self._positions = {self.chunk_id(i): i for i in range(self._n)}
+        return self._positions[chunk_id]
+
+    def get(self, chunk_id, default=None):
+        try:
+            return self[self.position(chunk_id)]
+        except KeyError:
+            return default
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the compiled corpus artifact.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="compile all_chunks into an artifact")
+    build.add_argument("--output", default=DEFAULT_ARTIFACT_PATH)
+    build.add_argument("--raw", action="store_true", help="skip citation-marker normalization")
+    build.add_argument("--dedupe", choices=("collapse", "link"), help="handle near-duplicate chunks")
+    build.add_argument("--dedupe-threshold", type=float, default=0.7)
+    build.add_argument("--rechunk", action="store_true",
+                       help="merge tiny chunks and split oversized ones (see rechunker.py)")
+    build.add_argument("--trace", action="store_true", help="print a per-stage timing breakdown")
+    info = sub.add_parser("info", help="print an artifact's header")
+    info.add_argument("path", nargs="?", default=DEFAULT_ARTIFACT_PATH)
+    info.add_argument("--verify", action="store_true", help="check the SHA-256 recorded in the header")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.trace:
+            enable()
+        from data_chunks import all_chunks as chunks
+
+        # Same stage order as chunk_stream.py export: normalize, dedupe, rechunk.
+        if not args.raw:
+            from citations import normalize_chunks
+
+            chunks = normalize_chunks(chunks)
+        if args.dedupe:
+            from near_duplicates import dedupe
+
+            chunks = dedupe(chunks, args.dedupe, args.dedupe_threshold)
+        if args.rechunk:
+            from rechunker import rechunk
+
+            chunks = rechunk(chunks)
+        digest = build_artifact(chunks, path=args.output)
+        print(f"Wrote {args.output} ({os.path.getsize(args.output)} bytes, sha256 {digest[:12]})")
+        if args.trace:
+            dump()
+    else:
+        with CorpusArtifact(args.path) as artifact:
+            print(f"{args.path}: format v{artifact.version}, {len(artifact)} chunks, "
+                  f"columns {', '.join(artifact.column_names)}, sha256 {artifact.digest[:12]}")
+            if args.verify:
+                if not artifact.verify():
+                    parser.exit(1, f"{args.path}: checksum mismatch\n")
+                print("Checksum OK.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# course_catalog.py
+
+"""Columnar course catalog with credit hours parsed from chunk text.
+
+``CourseCodeIndex`` already reads titles and credit hours out of prose such
+as "CSC 1301 - Principles of Comp. Sci. I is a 4-credit hour course" and
+"BIOL 2251K (Anatomy and Physiology I, 4 hours)". ``CourseCatalog`` packs
+that into one row per course code, sorted by code, with four columns::
+
+    codes          tuple of "SUBJ 1234" strings
+    titles         tuple of str ("" when the corpus gives no title)
+    credit_hours   int16[n], UNKNOWN_HOURS where no chunk states the hours
+    sources        int32[n] indices into ``chunk_ids``, the chunk the hours
+                   (or, failing that, the title) were read from
+
+plus a code -> row dictionary. ``credits`` totals the hours of any set of
+courses with one gather over ``credit_hours``, and ``plan_credits`` does the
+same for a year or term of a degree_plans.DegreePlans plan, so "how many
+hours is the CS freshman year" needs neither retrieval nor generation.
+
+``python course_catalog.py build`` writes the catalog to an .npz file that
+``CourseCatalog.load`` reads back without re-parsing the corpus.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from course_codes import CourseCodeIndex, find_course_codes, normalize_course_code
+from data_chunks import every_chunk
+from instrumentation import traced
+
+UNKNOWN_HOURS = -1
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "course_catalog.npz")
+
+
+class CourseCatalog:
+    """Code-indexed table of course codes, titles, credit hours and sources."""
+
+    def __init__(self, codes, titles, credit_hours, sources, chunk_ids):
+        self.codes = tuple(codes)
+        self.titles = tuple(titles)
+        self.credit_hours = np.asarray(credit_hours, dtype=np.int16)
+        self.sources = np.asarray(sources, dtype=np.int32)
+        self.chunk_ids = tuple(chunk_ids)
+        self._rows = {code: row for row, code in enumerate(self.codes)}
+
+    @classmethod
+    @traced("catalog.build")
+    def from_chunks(cls, chunks=None):
+        """Extract the catalog from ``chunks`` (default: every declared chunk set)."""
+        if chunks is None:
+            chunks = every_chunk
+        courses = sorted(CourseCodeIndex(chunks), key=lambda course: course.code)
+        chunk_ids = list(dict.fromkeys(course.source_chunk_id for course in courses
+                                       if course.source_chunk_id is not None))
+        positions = {chunk_id: i for i, chunk_id in enumerate(chunk_ids)}
+        return cls(
+            [course.code for course in courses],
+            [course.title or "" for course in courses],
+            [UNKNOWN_HOURS if course.credit_hours is None else course.credit_hours for course in courses],
+            [positions.get(course.source_chunk_id, -1) for course in courses],
+            chunk_ids,
+        )
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        return self.row(code) is not None
+
+    def row(self, code):
+        """Row of ``code`` in any spelling ("csc1301"), or None."""
+        normalized = normalize_course_code(code)
+        return self._rows.get(normalized) if normalized else None
+
+    def get(self, code):
+        """``{"code", "title", "credit_hours", "source_chunk_id"}`` for ``code``, or None."""
+        row = self.row(code)
+        if row is None:
+            return None
+        hours = int(self.credit_hours[row])
+        source = int(self.sources[row])
+        return {
+            "code": self.codes[row],
+            "title": self.titles[row] or None,
+            "credit_hours": None if hours == UNKNOWN_HOURS else hours,
+            "source_chunk_id": self.chunk_ids[source] if source >= 0 else None,
+        }
+
+    def credits(self, codes):
+        """Total the credit hours of ``codes``.
+
+        ``codes`` is an iterable of course codes or a text that mentions
+        them; repeats are counted once. Returns ``{"credit_hours", "counted",
+        "unknown"}``: the total over ``counted``, and the codes that are not
+        in the catalog or whose hours the corpus does not state.
+        """
+        if isinstance(codes, str):
+            codes = find_course_codes(codes)
+        normalized = dict.fromkeys(normalize_course_code(code) or code for code in codes)
+        rows = [self._rows.get(code, -1) for code in normalized]
+        if rows:
+            hours = np.where(np.array(rows) >= 0, self.credit_hours[rows], UNKNOWN_HOURS)
+        else:
+            hours = np.empty(0, dtype=np.int16)
+        known = hours != UNKNOWN_HOURS
+        codes = list(normalized)
+        return {
+            "credit_hours": int(hours[known].sum()),
+            "counted": [code for code, ok in zip(codes, known) if ok],
+            "unknown": [code for code, ok in zip(codes, known) if not ok],
+        }
+
+    def plan_credits(self, plans, program, year=None, term=None):
+        """``credits`` of one term or year of ``program`` in a ``DegreePlans``, or of all four years.
+
+        Raises KeyError when the program or year has no plan, or when a plan
+        does not split that year into ``term`` (the CS plan has no terms).
+        """
+        years = [year] if year is not None else range(1, 5)
+        codes = []
+        for number in years:
+            try:
+                year_plan = plans.plan(program, number)
+            except KeyError:
+                if year is not None:
+                    raise
+                continue
+            if term is not None and term.capitalize() not in year_plan.terms:
+                raise KeyError(f"{year_plan.program} year {number} has no {term.capitalize()} term; "
+                               f"it has {', '.join(year_plan.terms)}")
+            codes.extend(year_plan.courses(term))
+        return self.credits(codes)
+
+    def save(self, path=DEFAULT_CATALOG_PATH):
+        """Write the catalog to ``path`` (.npz) atomically."""
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            credit_hours=self.credit_hours,
+            sources=self.sources,
+            strings=np.array(json.dumps([self.codes, self.titles, self.chunk_ids])),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOG_PATH):
+        with np.load(path, allow_pickle=False) as data:
+            codes, titles, chunk_ids = json.loads(str(data["strings"]))
+            return cls(codes, titles, data["credit_hours"], data["sources"], chunk_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the course catalog table.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="extract the catalog from the corpus")
+    build.add_argument("--output", default=DEFAULT_CATALOG_PATH)
+    total = sub.add_parser("credits", help="total the credit hours of some courses")
+    total.add_argument("codes", nargs="+", help='course codes, e.g. "CSC 1301" CSC1302')
+    plan = sub.add_parser("plan", help="total the credit hours of a degree plan")
+    plan.add_argument("program", help='program name or alias, e.g. "Computer Science" or cs')
+    plan.add_argument("--year", type=int, choices=(1, 2, 3, 4))
+    plan.add_argument("--term", choices=("fall", "spring"))
+    for command in (total, plan):
+        command.add_argument("--catalog", default=DEFAULT_CATALOG_PATH,
+                             help="catalog built by 'build' (extracted from the corpus if missing)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        catalog = CourseCatalog.from_chunks()
+        catalog.save(args.output)
+        known = int((catalog.credit_hours != UNKNOWN_HOURS).sum())
+        print(f"Wrote {args.output} ({len(catalog)} courses, {known} with credit hours)")
+        return
+
+    catalog = CourseCatalog.load(args.catalog) if os.path.exists(args.catalog) else CourseCatalog.from_chunks()
+    if args.command == "credits":
+        result = catalog.credits(" ".join(args.codes).upper())
+    else:
+        from degree_plans import DegreePlans
+
+        plans = DegreePlans()
+        if args.program not in plans:
+            parser.exit(1, f"Unknown program {args.program!r}; known: {', '.join(plans.programs())}\n")
+        try:
+            result = catalog.plan_credits(plans, args.program, args.year, args.term)
+        except KeyError as error:
+            parser.exit(1, f"{error.args[0]}\n")
+    print(f"{result['credit_hours']} credit hours over {', '.join(result['counted']) or 'no courses'}")
+    if result["unknown"]:
+        print(f"Hours not stated for: {', '.join(result['unknown'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# course_codes.py
+
+"""Recognising and normalising GSU course codes such as "CSC 4330".
+
+A course code is a 2-4 letter subject followed by a 4 digit number with an
+optional lab/section suffix ("BIOL 2251K", "BIOL 2260L"). Slash lists that
+share a subject ("CSC 4320/4330") expand to one code per number. Room
+numbers written the same way after a campus name ("Dunwoody NB 1200") are
+not courses and are skipped.
+"""
+
+import re
+
+from data_chunks import every_chunk
+
+_CODE_RE = re.compile(r"\b([A-Z]{2,4})\s?(\d{4}[A-Z]?)((?:/\d{4}[A-Z]?\b)*)(?![\w-])")
+_CODE_RE_ANY_CASE = re.compile(_CODE_RE.pattern, re.IGNORECASE)
+# GSU campuses; "<campus> XX 1234" is a building and room.
+_CAMPUS_RE = re.compile(r"\b(?:Alpharetta|Atlanta|Clarkston|Decatur|Dunwoody|Newton|Perimeter)\s+$")
+_CAMPUS_LOOKBEHIND = 16
+
+
+def normalize_course_code(code):
+    """Canonical "SUBJ 1234" form of ``code``, or None if it is not a course code."""
+    match = re.fullmatch(r"\s*([A-Za-z]{2,4})\s*(\d{4}[A-Za-z]?)\s*", code)
+    if match is None:
+        return None
+    return f"{match.group(1).upper()} {match.group(2).upper()}"
+
+
+def iter_course_codes(text, subjects=None):
+    """Yield ``(start, end, code)`` for every course code mentioned in ``text``.
+
+    By default only upper-case subjects are recognised, which keeps prose
+    like "in 2019" from turning into a course. Passing ``subjects`` (a set of
+    upper-case subject prefixes) matches case-insensitively but only accepts
+    those subjects, which suits free-form user queries.
+    """
+    pattern = _CODE_RE if subjects is None else _CODE_RE_ANY_CASE
+    for match in pattern.finditer(text):
+        subject = match.group(1).upper()
+        if subjects is not None and subject not in subjects:
+            continue
+        if _CAMPUS_RE.search(text, max(0, match.start() - _CAMPUS_LOOKBEHIND), match.start()):
+            continue
+        numbers = [match.group(2)] + [n for n in match.group(3).split("/") if n]
+        for number in numbers:
+            yield match.start(), match.end(), f"{subject} {number.upper()}"
+
+
+def find_course_codes(text, subjects=None):
+    """Distinct course codes in ``text`` in order of first appearance."""
+    return list(dict.fromkeys(code for _, _, code in iter_course_codes(text, subjects)))
+
+
+# --- Course lookup table -------------------------------------------------
+
+_CONNECTORS = frozenset({"of", "and", "the", "for", "in", "to", "&", "with", "I", "II", "III"})
+_DASH_TITLE_RE = re.compile(
+    r"\s+-\s+(.+?)(?=\s+is an?\s|\s+-\s+\d|\s*[,;&\[]|\s+and\s+(?:either\s+)?[A-Z]{2,4}\s?\d{4}|\.?$)"
+)
+_PAREN_AFTER_RE = re.compile(r"\s*\(([^()]+)\)")
+_PAREN_HOURS_RE = re.compile(r"(.+?),\s*(\d+)\s*(?:credit\s*)?hours?(?:\s+total)?\s*$")
+_CREDITS_AFTER_RE = re.compile(r"\s+(?:is an?|-)\s+(\d+)[- ]credit")
+_CREDITS_BEFORE_RE = re.compile(r"\b(\d+)[- ]credit(?:[- ]hours?)?(?:\s+course)?\s*$")
+_MAX_TITLE_LENGTH = 80
+
+
+class Course:
+    """What the corpus says about one course code.
+
+    ``source_chunk_id`` is the chunk the credit hours were read from, or the
+    one the title was read from when no chunk states the hours.
+    """
+
+    __slots__ = ("code", "title", "credit_hours", "chunk_ids", "source_chunk_id")
+
+    def __init__(self, code, title=None, credit_hours=None, chunk_ids=(), source_chunk_id=None):
+        self.code = code
+        self.title = title
+        self.credit_hours = credit_hours
+        self.chunk_ids = tuple(chunk_ids)
+        self.source_chunk_id = source_chunk_id
+
+    def __repr__(self):
+        return (f"Course(code={self.code!r}, title={self.title!r}, "
+                f"credit_hours={self.credit_hours!r}, chunk_ids={self.chunk_ids!r}, "
+                f"source_chunk_id={self.source_chunk_id!r})")
+
+
+def _title_before(prefix):
+    """Title-case run immediately preceding "(CODE)", e.g. "Data Structures"."""
+    words = prefix.split()
+    start = len(words)
+    while start > 0 and (words[start - 1][:1].isupper() or words[start - 1] in _CONNECTORS):
+        start -= 1
+    while start < len(words) and words[start] in _CONNECTORS - {"I", "II", "III"}:
+        start += 1
+    title = " ".join(words[start:])
+    return title if title and len(title) <= _MAX_TITLE_LENGTH else None
+
+
+def _describe_mention(text, start, end, single):
+    """Return ``(title, priority, credit_hours)`` stated next to one code mention."""
+    title, priority, credits = None, 0, None
+    rest = text[end:]
+
+    dash = _DASH_TITLE_RE.match(rest) if single else None
+    if dash and len(dash.group(1)) <= _MAX_TITLE_LENGTH:
+        title, priority = dash.group(1).strip(), 3
+        rest = rest[dash.end():]
+    else:
+        paren = _PAREN_AFTER_RE.match(rest) if single else None
+        if paren and not find_course_codes(paren.group(1)) and paren.group(1)[:1].isupper():
+            content = paren.group(1).strip()
+            hours = _PAREN_HOURS_RE.match(content)
+            if hours:
+                content, credits = hours.group(1).strip(), int(hours.group(2))
+            if len(content) <= _MAX_TITLE_LENGTH:
+                title, priority = content, 2
+        elif text[:start].endswith("(") and text[end:end + 1] == ")":
+            title = _title_before(text[:start - 1])
+            priority = 1 if title else 0
+
+    if credits is None:
+        after = _CREDITS_AFTER_RE.match(rest)
+        before = _CREDITS_BEFORE_RE.search(text[:start])
+        if after:
+            credits = int(after.group(1))
+        elif before:
+            credits = int(before.group(1))
+    return title, priority, credits
+
+
+class CourseCodeIndex:
+    """Precomputed map from normalised course code to a ``Course``.
+
+    Built once from ``chunks``, by default every declared chunk set since
+    most course chunks are not published in ``all_chunks``. ``lookup`` and
+    ``chunks_for`` are plain dict reads, so "what is CSC 2720" and "where
+    does ACCT 2101 appear" need no embedding call.
+    """
+
+    def __init__(self, chunks=None):
+        chunks = every_chunk if chunks is None else chunks
+        chunk_ids = {}
+        titles = {}
+        credits = {}
+        for chunk in chunks:
+            text = chunk["text"]
+            mentions = list(iter_course_codes(text))
+            spans = {}
+            for start, end, code in mentions:
+                spans[(start, end)] = spans.get((start, end), 0) + 1
+            for start, end, code in mentions:
+                ids = chunk_ids.setdefault(code, [])
+                if not ids or ids[-1] != chunk["id"]:
+                    ids.append(chunk["id"])
+                title, priority, hours = _describe_mention(text, start, end, spans[(start, end)] == 1)
+                if title and priority > titles.get(code, (None, 0))[1]:
+                    titles[code] = (title, priority, chunk["id"])
+                if hours is not None:
+                    credits.setdefault(code, (hours, chunk["id"]))
+
+        self._courses = {}
+        for code, ids in chunk_ids.items():
+            title, _, title_source = titles.get(code, (None, 0, None))
+            hours, source = credits.get(code, (None, title_source))
+            self._courses[code] = Course(code, title, hours, ids, source)
+
+    def __len__(self):
+        return len(self._courses)
+
+    def __contains__(self, code):
+        return self.lookup(code) is not None
+
+    def __iter__(self):
+        return iter(self._courses.values())
+
+    def lookup(self, code):
+        """The ``Course`` for ``code`` in any spelling ("csc2720"), or None."""
+        normalized = normalize_course_code(code)
+        return self._courses.get(normalized) if normalized else None
+
+    def chunks_for(self, code):
+        """Ids of every chunk that mentions ``code``, in corpus order."""
+        course = self.lookup(code)
+        return course.chunk_ids if course else ()
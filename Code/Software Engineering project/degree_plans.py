@@ -0,0 +1,235 @@
+# degree_plans.py
+
+"""Structured degree plans compiled from the "Year N" plan chunks.
+
+Every B.B.A. major has four chunks (``acct_bba_year1`` ... ``acct_bba_year4``)
+that describe the recommended Fall and Spring courses and the milestones of
+one year in prose, and the Computer Science plan has one chunk per year
+(``cs_four_year_plan_first_year`` ...) without a term split. ``DegreePlans``
+compiles them into a program -> year -> term table of course codes plus the
+year's milestones, so "what do finance majors take sophomore spring" is a
+dictionary lookup instead of an LLM pass over the prose.
+"""
+
+import argparse
+import re
+
+from course_codes import find_course_codes
+from data_chunks import every_chunk
+from tokens import split_sentences
+
+TERMS = ("Fall", "Spring")
+WHOLE_YEAR = "Year"  # for plans that do not split a year into terms
+
+_BBA_PLAN_ID_RE = re.compile(r"^(?P<alias>[a-z]+)_bba_year(?P<year>[1-4])$")
+_CS_PLAN_ID_RE = re.compile(r"^(?P<alias>cs)_four_year_plan_(?P<year>first|second|third|fourth)_year$")
+_BBA_NAME_RE = re.compile(r"\bfor (?P<name>.+?) B\.B\.A\.")
+_TERM_RE = re.compile(r"\b(?:(?P<term>Fall|Spring) term|The final semester)\b")
+_MILESTONE_RE = re.compile(r"\b(?:Crucial )?[Mm]ilestones?(?::|\s+include\b)\s*")
+_END_OF_YEAR_RE = re.compile(r"\bBy (?:the end of|graduation)\b")
+
+_ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4}
+# Class-year words win over ordinals, which also number semesters
+# ("first semester of sophomore year").
+_CLASS_YEARS = {"freshman": 1, "sophomore": 2, "junior": 3, "senior": 4}
+_ORDINAL_WORDS = {**_ORDINALS, "1st": 1, "2nd": 2, "3rd": 3, "4th": 4}
+_ORDINAL_YEAR_RE = re.compile(r"\b(first|second|third|fourth|1st|2nd|3rd|4th)\s+year\b")
+_YEAR_NUMBER_RE = re.compile(r"\byear\s*([1-4])\b")
+_SEMESTER_RE = re.compile(r"\b(first|1st|second|2nd|last|final) semester\b")
+_SEMESTER_TERMS = {"first": "Fall", "1st": "Fall", "second": "Spring", "2nd": "Spring",
+                   "last": "Spring", "final": "Spring"}
+_WORD_RE = re.compile(r"[a-z0-9&]+")
+# Aliases of two letters are only matched when listed here; "as" and "re"
+# are common English words.
+_SHORT_ALIASES = frozenset({"cs"})
+
+
+class YearPlan:
+    """One program year: course codes per term and the year's milestones."""
+
+    __slots__ = ("program", "year", "terms", "milestones", "chunk_id")
+
+    def __init__(self, program, year, terms, milestones, chunk_id):
+        self.program = program
+        self.year = year
+        self.terms = terms
+        self.milestones = milestones
+        self.chunk_id = chunk_id
+
+    def courses(self, term=None):
+        """Course codes of ``term``, or of the whole year when ``term`` is None."""
+        if term is None:
+            return list(dict.fromkeys(code for codes in self.terms.values() for code in codes))
+        return list(self.terms.get(term.capitalize(), ()))
+
+    def __repr__(self):
+        return (f"YearPlan(program={self.program!r}, year={self.year!r}, terms={self.terms!r}, "
+                f"milestones={self.milestones!r}, chunk_id={self.chunk_id!r})")
+
+
+def parse_plan_chunk(chunk):
+    """Return ``(alias, program, YearPlan)`` for a plan chunk, or None for other chunks."""
+    match = _BBA_PLAN_ID_RE.match(chunk["id"]) or _CS_PLAN_ID_RE.match(chunk["id"])
+    if match is None:
+        return None
+    alias = match.group("alias")
+    year = match.group("year")
+    year = int(year) if year.isdigit() else _ORDINALS[year]
+    text = chunk["text"]
+
+    if alias == "cs":
+        program = "Computer Science"
+    else:
+        name = _BBA_NAME_RE.search(text)
+        program = name.group("name") if name else alias.upper()
+
+    milestone = _MILESTONE_RE.search(text)
+    body = text[:milestone.start()] if milestone else text
+    milestones = tuple(sentence[:1].upper() + sentence[1:]
+                       for sentence in split_sentences(text[milestone.end():])) if milestone else ()
+
+    terms = {}
+    markers = list(_TERM_RE.finditer(body))
+    if markers:
+        # Courses named before the first marker belong to the term before
+        # it ("Students take ... BUSA 4000. The final semester includes ..."),
+        # or to the whole year when the first marker is already Fall.
+        leading = find_course_codes(body[:markers[0].start()])
+        if leading:
+            terms["Fall" if (markers[0].group("term") or "Spring") == "Spring" else WHOLE_YEAR] = tuple(leading)
+        for marker, following in zip(markers, markers[1:] + [None]):
+            term = marker.group("term") or "Spring"
+            segment = body[marker.end():following.start() if following else len(body)]
+            terms[term] = tuple(find_course_codes(segment))
+    else:
+        end = _END_OF_YEAR_RE.search(body)
+        terms[WHOLE_YEAR] = tuple(find_course_codes(body[:end.start()] if end else body))
+    return alias, program, YearPlan(program, year, terms, milestones, chunk["id"])
+
+
+class DegreePlans:
+    """Program -> year -> term course table compiled from plan chunks.
+
+    ``chunks`` defaults to every declared chunk set, since most plans live
+    in sets that are not published in ``all_chunks``. Programs can be named
+    by their full name ("Finance"), case-insensitively, or by the chunk id
+    prefix ("finance", "acct", "cs"). ``ask`` skips the two-letter prefixes
+    "as" and "re", which are ordinary words in a question.
+    """
+
+    def __init__(self, chunks=None):
+        if chunks is None:
+            chunks = every_chunk
+        self._plans = {}
+        self._aliases = {}
+        for chunk in chunks:
+            parsed = parse_plan_chunk(chunk)
+            if parsed is None:
+                continue
+            alias, program, plan = parsed
+            self._plans.setdefault(program, {})[plan.year] = plan
+            self._aliases[alias] = program
+            self._aliases[program.lower()] = program
+        self._by_code = {}
+        for program, years in self._plans.items():
+            for year, plan in sorted(years.items()):
+                for term, codes in plan.terms.items():
+                    for code in codes:
+                        self._by_code.setdefault(code, []).append((program, year, term))
+
+    def programs(self):
+        return sorted(self._plans)
+
+    def __contains__(self, program):
+        return self.resolve(program) is not None
+
+    def resolve(self, program):
+        """Canonical program name for a name or alias, or None."""
+        return self._aliases.get(program.strip().lower())
+
+    def plan(self, program, year):
+        """The ``YearPlan`` of ``program`` for ``year`` (1-4); KeyError if unknown."""
+        name = self.resolve(program)
+        if name is None or year not in self._plans[name]:
+            raise KeyError(f"no plan for {program!r} year {year}")
+        return self._plans[name][year]
+
+    def courses(self, program, year, term=None):
+        return self.plan(program, year).courses(term)
+
+    def milestones(self, program, year):
+        return list(self.plan(program, year).milestones)
+
+    def where_taken(self, code):
+        """``[(program, year, term)]`` for every plan that schedules course ``code``."""
+        return list(self._by_code.get(code, ()))
+
+    def ask(self, question):
+        """Answer "what do <program> majors take <year> <term>" style questions.
+
+        Returns ``{"program", "year", "term", "courses", "milestones",
+        "chunk_id"}``, or None when the question does not name both a known
+        program and a year. Without a term the whole year is returned.
+        """
+        words = _WORD_RE.findall(question.lower())
+        text = " ".join(words)
+        program = None
+        for alias in sorted(self._aliases, key=len, reverse=True):
+            if (len(alias) > 2 or alias in _SHORT_ALIASES) and re.search(rf"\b{re.escape(alias)}\b", text):
+                program = self._aliases[alias]
+                break
+        year = next((_CLASS_YEARS[word] for word in words if word in _CLASS_YEARS), None)
+        if year is None:
+            ordinal = _ORDINAL_YEAR_RE.search(text)
+            number = _YEAR_NUMBER_RE.search(text)
+            if ordinal:
+                year = _ORDINAL_WORDS[ordinal.group(1)]
+            elif number:
+                year = int(number.group(1))
+            else:
+                year = next((_ORDINAL_WORDS[word] for word in words if word in _ORDINAL_WORDS), None)
+        if program is None or year is None or year not in self._plans[program]:
+            return None
+        term = next((word.capitalize() for word in words if word.capitalize() in TERMS), None)
+        if term is None:
+            semester = _SEMESTER_RE.search(text)
+            term = _SEMESTER_TERMS[semester.group(1)] if semester else None
+        plan = self._plans[program][year]
+        if term is not None and term not in plan.terms:
+            term = None
+        return {
+            "program": program,
+            "year": year,
+            "term": term,
+            "courses": plan.courses(term),
+            "milestones": list(plan.milestones),
+            "chunk_id": plan.chunk_id,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer degree-plan questions from the compiled plan table.")
+    parser.add_argument("question", nargs="?", help='e.g. "what do finance majors take sophomore spring"')
+    parser.add_argument("--course", help="list the plans that schedule this course code")
+    args = parser.parse_args()
+
+    plans = DegreePlans()
+    if args.course:
+        for program, year, term in plans.where_taken(args.course.upper()):
+            print(f"{program}\tyear {year}\t{term}")
+        return
+    if not args.question:
+        print("\n".join(plans.programs()))
+        return
+    answer = plans.ask(args.question)
+    if answer is None:
+        parser.exit(1, "Could not find a program and year in the question.\n")
+    term = answer["term"] or "whole year"
+    print(f"{answer['program']}, year {answer['year']}, {term} ({answer['chunk_id']}):")
+    print("  " + ", ".join(answer["courses"]))
+    for milestone in answer["milestones"]:
+        print(f"  Milestone: {milestone}")
+
+
+if __name__ == "__main__":
+    main()
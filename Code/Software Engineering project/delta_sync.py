@@ -0,0 +1,191 @@
+# delta_sync.py
+
+"""Incremental publishing of the corpus to the remote vector index.
+
+uploadToPinecone.js re-uploads every chunk and never deletes ids that were
+removed from data_chunks.py. ``python delta_sync.py`` instead keeps a local
+manifest of id -> content hash for the last published state, diffs it against
+the current ``all_chunks`` and sends only the upserts and deletes that
+changed, in batches. Only upserted chunks are embedded, through the embedding
+cache, so publish time follows the size of the change.
+
+The remote is pluggable: anything with ``upsert(records)`` and
+``delete(ids)`` works. ``PineconeRemote`` talks to the same index as the
+Node backend; ``--dry-run`` only prints the plan.
+
+The first sync against an index filled by uploadToPinecone.js has no
+manifest, so it would not know which remote ids are stale. ``--bootstrap``
+seeds the manifest from the remote's ``list_ids()`` first: ids that are no
+longer in the corpus get deleted, and the others are re-upserted once since
+their remote content is unknown.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+
+from citations import normalize_chunks
+from data_chunks import all_chunks
+from embedding_cache import EMBEDDING_MODEL, EmbeddingCache, chunk_key, embed_chunks
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sync_manifest.json")
+
+
+def content_hash(chunk, model=EMBEDDING_MODEL):
+    """Hash of everything the remote stores for ``chunk``: its vector and metadata."""
+    digest = hashlib.sha256(chunk_key(chunk, model).encode("ascii"))
+    digest.update(json.dumps(chunk.get("metadata", {}), sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """The id -> content hash map of the last published state, stored as JSON."""
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.hashes = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                self.hashes = json.load(handle)
+
+    def save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self.hashes, handle, indent=0, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def plan(manifest, chunks, model=EMBEDDING_MODEL):
+    """Return ``(upserts, deletes)``: chunks that are new or changed, and ids that are gone."""
+    current = {}
+    upserts = []
+    for chunk in chunks:
+        digest = current[chunk["id"]] = content_hash(chunk, model)
+        if manifest.hashes.get(chunk["id"]) != digest:
+            upserts.append(chunk)
+    deletes = sorted(chunk_id for chunk_id in manifest.hashes if chunk_id not in current)
+    return upserts, deletes
+
+
+def bootstrap(manifest, remote_ids):
+    """Add every id in ``remote_ids`` that the manifest does not know yet.
+
+    They are recorded with an empty hash, which matches no chunk, so the
+    next ``plan`` deletes the ones that left the corpus and re-upserts the
+    rest. Returns the number of ids added.
+    """
+    added = 0
+    for chunk_id in remote_ids:
+        if chunk_id not in manifest.hashes:
+            manifest.hashes[chunk_id] = ""
+            added += 1
+    return added
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def sync(remote, embed, manifest, chunks=None, batch_size=100, cache=None, model=EMBEDDING_MODEL):
+    """Bring ``remote`` in line with ``chunks`` (default ``all_chunks``).
+
+    The manifest is saved after every batch, so an interrupted sync resumes
+    where it stopped. Returns ``{"upserted": n, "deleted": n, "unchanged": n}``.
+    """
+    chunks = list(all_chunks if chunks is None else chunks)
+    upserts, deletes = plan(manifest, chunks, model)
+
+    for batch in _batches(deletes, batch_size):
+        remote.delete(batch)
+        for chunk_id in batch:
+            del manifest.hashes[chunk_id]
+        manifest.save()
+
+    for batch in _batches(upserts, batch_size):
+        vectors = embed_chunks(embed, batch, cache=cache, model=model, prune=False)
+        remote.upsert([
+            {
+                "id": chunk["id"],
+                "values": vector.tolist(),
+                "metadata": {
+                    "text": chunk["text"],
+                    "source": chunk.get("metadata", {}).get("source", ""),
+                    "topic": chunk.get("metadata", {}).get("topic", ""),
+                },
+            }
+            for chunk, vector in zip(batch, vectors)
+        ])
+        for chunk in batch:
+            manifest.hashes[chunk["id"]] = content_hash(chunk, model)
+        manifest.save()
+
+    return {"upserted": len(upserts), "deleted": len(deletes), "unchanged": len(chunks) - len(upserts)}
+
+
+class PineconeRemote:
+    """Remote index client for the Pinecone index used by the Node backend."""
+
+    def __init__(self, index_name=None, api_key=None):
+        from pinecone import Pinecone
+
+        api_key = api_key or os.environ.get("PINECONE_API_KEY")
+        if not api_key:
+            raise RuntimeError("PINECONE_API_KEY not found in environment variables")
+        index_name = index_name or os.environ.get("PINECONE_INDEX_NAME", "gsu-chatbot")
+        self.index = Pinecone(api_key=api_key).Index(index_name)
+
+    def upsert(self, records):
+        self.index.upsert(vectors=records)
+
+    def delete(self, ids):
+        self.index.delete(ids=list(ids))
+
+    def list_ids(self):
+        """Every id in the index; ``Index.list`` pages through them (serverless indexes only)."""
+        for page in self.index.list():
+            yield from page
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish only the chunks that changed since the last sync.")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--raw", action="store_true", help="skip citation-marker normalization")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without touching the remote")
+    parser.add_argument("--bootstrap", action="store_true",
+                        help="seed the manifest with the ids already in the remote index")
+    args = parser.parse_args()
+
+    chunks = list(all_chunks if args.raw else normalize_chunks(all_chunks))
+    manifest = Manifest(args.manifest)
+    remote = None
+    if args.bootstrap:
+        remote = PineconeRemote()
+        added = bootstrap(manifest, remote.list_ids())
+        print(f"Bootstrapped {added} remote ids into the manifest")
+    if args.dry_run:
+        upserts, deletes = plan(manifest, chunks)
+        for chunk in upserts:
+            print(f"upsert {chunk['id']}")
+        for chunk_id in deletes:
+            print(f"delete {chunk_id}")
+        print(f"{len(upserts)} upserts, {len(deletes)} deletes, {len(chunks) - len(upserts)} unchanged")
+        return
+
+    from embedding_pipeline import BatchEmbedder, OpenAIEmbedder
+
+    summary = sync(remote or PineconeRemote(), BatchEmbedder(OpenAIEmbedder()), manifest, chunks,
+                   batch_size=args.batch_size, cache=EmbeddingCache())
+    print(f"{summary['upserted']} upserted, {summary['deleted']} deleted, {summary['unchanged']} unchanged")
+
+
+if __name__ == "__main__":
+    main()
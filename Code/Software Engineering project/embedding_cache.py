@@ -0,0 +1,121 @@
+# embedding_cache.py
+
+"""Persistent content-hash cache for chunk embeddings.
+
+Each vector is stored under a SHA-256 of the chunk id, its text and the
+embedding model name, so a corpus rebuild only requests embeddings for
+chunks that are new or whose text changed since the last build.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from data_chunks import all_chunks
+from instrumentation import count, traced
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache.npz")
+
+
+def chunk_key(chunk, model=EMBEDDING_MODEL):
+    """Content hash identifying one chunk's embedding under ``model``."""
+    digest = hashlib.sha256()
+    for part in (model, chunk["id"], chunk["text"]):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """Maps content hashes to float32 vectors, persisted as a single .npz file."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self._vectors = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        with np.load(self.path, allow_pickle=False) as data:
+            keys = data["keys"]
+            vectors = data["vectors"]
+        self._vectors = {str(key): vectors[i] for i, key in enumerate(keys)}
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __contains__(self, key):
+        return key in self._vectors
+
+    def get(self, key):
+        return self._vectors.get(key)
+
+    def put(self, key, vector):
+        self._vectors[key] = np.asarray(vector, dtype=np.float32)
+        self._dirty = True
+
+    def retain(self, keys):
+        """Drop every entry whose key is not in ``keys``."""
+        keys = set(keys)
+        stale = [key for key in self._vectors if key not in keys]
+        for key in stale:
+            del self._vectors[key]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the cache atomically; a no-op when nothing changed."""
+        if not self._dirty or not self.path:
+            return
+        keys = list(self._vectors)
+        if keys:
+            vectors = np.stack([self._vectors[key] for key in keys])
+        else:
+            vectors = np.empty((0, 0), dtype=np.float32)
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, keys=np.array(keys, dtype=str), vectors=vectors)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+
+@traced("embed")
+def embed_chunks(embed, chunks=None, cache=None, model=EMBEDDING_MODEL, prune=False, keep=()):
+    """Return a (len(chunks), dim) float32 matrix, embedding only cache misses.
+
+    ``embed`` receives the list of texts that are missing from the cache and
+    must return one vector per text in the same order. With ``prune`` the
+    cache forgets every entry except these chunks and the keys in ``keep``;
+    only pass it when ``chunks`` is the whole corpus.
+    """
+    chunks = list(all_chunks if chunks is None else chunks)
+    cache = EmbeddingCache() if cache is None else cache
+
+    keys = [chunk_key(chunk, model) for chunk in chunks]
+    missing = [i for i, key in enumerate(keys) if key not in cache]
+    count("embed.cache_hits", len(keys) - len(missing))
+    count("embed.cache_misses", len(missing))
+    if missing:
+        vectors = embed([chunks[i]["text"] for i in missing])
+        if len(vectors) != len(missing):
+            raise ValueError(f"embed returned {len(vectors)} vectors for {len(missing)} texts")
+        for i, vector in zip(missing, vectors):
+            cache.put(keys[i], vector)
+
+    if prune:
+        cache.retain(keys + list(keep))
+    cache.save()
+
+    if not chunks:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([cache.get(key) for key in keys])
@@ -0,0 +1,187 @@
+# embedding_pipeline.py
+
+"""Batched, concurrent embedding generation for the corpus build.
+
+Texts are grouped into token-bounded batches and several batches are sent
+at once, up to a configurable concurrency limit. Rate-limited requests are
+retried with exponential backoff, and vectors are written back in input
+order. The embedding backend is pluggable: ``OpenAIEmbedder`` talks to the
+API, ``FakeEmbedder`` produces deterministic vectors offline for benchmarks.
+
+Run ``python embedding_pipeline.py --fake`` to time a build without network.
+The build embeds citation-normalized text (see citations.py) unless
+``--raw`` is given.
+"""
+
+import argparse
+import hashlib
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from citations import normalize_chunks
+from data_chunks import all_chunks
+from embedding_cache import EMBEDDING_MODEL, EmbeddingCache, chunk_key, embed_chunks
+from instrumentation import count, dump, enable, traced
+from tokens import count_tokens
+
+EMBEDDING_DIMENSION = 1536  # text-embedding-3-small
+
+
+class RateLimitError(Exception):
+    """Raised by a backend when the provider answers with HTTP 429."""
+
+
+def _is_rate_limited(error):
+    # insufficient_quota also comes back as a 429 but retrying cannot fix it.
+    if getattr(error, "code", None) == "insufficient_quota":
+        return False
+    if isinstance(error, RateLimitError):
+        return True
+    return 429 in (getattr(error, "status", None), getattr(error, "status_code", None))
+
+
+class OpenAIEmbedder:
+    """Embedding backend backed by the OpenAI embeddings endpoint."""
+
+    def __init__(self, model=EMBEDDING_MODEL, client=None):
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+        self.model = model
+        self.client = client
+
+    def __call__(self, texts):
+        response = self.client.embeddings.create(model=self.model, input=list(texts))
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class FakeEmbedder:
+    """Deterministic offline backend that can simulate request latency."""
+
+    def __init__(self, dimension=EMBEDDING_DIMENSION, latency=0.0):
+        self.dimension = dimension
+        self.latency = latency
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for i, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+            vectors[i] = np.random.default_rng(seed).standard_normal(self.dimension)
+        return vectors
+
+
+def make_batches(texts, max_tokens, max_items):
+    """Split ``texts`` into lists of indices bounded by tokens and item count.
+
+    A single text larger than ``max_tokens`` still gets a batch of its own.
+    """
+    batches = []
+    current, current_tokens = [], 0
+    for i, text in enumerate(texts):
+        tokens = count_tokens(text)
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class BatchEmbedder:
+    """Callable that embeds a list of texts through ``backend`` in parallel batches.
+
+    Instances can be passed anywhere an ``embed(texts)`` callable is expected,
+    e.g. ``embed_chunks`` or ``VectorIndex.from_chunks``.
+    """
+
+    def __init__(self, backend, max_batch_tokens=20000, max_batch_size=256,
+                 max_concurrency=4, max_retries=5, base_delay=0.5, max_delay=30.0):
+        self.backend = backend
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @traced("embed.batch")
+    def _embed_batch(self, texts):
+        for attempt in range(self.max_retries + 1):
+            try:
+                vectors = self.backend(texts)
+            except Exception as error:
+                if attempt == self.max_retries or not _is_rate_limited(error):
+                    raise
+                count("embed.retries")
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                time.sleep(delay * (0.5 + random.random() / 2))
+                continue
+            if len(vectors) != len(texts):
+                raise ValueError(f"backend returned {len(vectors)} vectors for {len(texts)} texts")
+            return vectors
+
+    def __call__(self, texts):
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        batches = make_batches(texts, self.max_batch_tokens, self.max_batch_size)
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as pool:
+            results = list(pool.map(lambda batch: self._embed_batch([texts[i] for i in batch]), batches))
+
+        output = None
+        for batch, vectors in zip(batches, results):
+            vectors = np.asarray(vectors, dtype=np.float32)
+            if output is None:
+                output = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            output[batch] = vectors
+        return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embed all_chunks into the local embedding cache.")
+    parser.add_argument("--fake", action="store_true", help="use the offline FakeEmbedder")
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated seconds per fake request")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--batch-tokens", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--cache", default=None, help="cache file (defaults to .embedding_cache.npz)")
+    parser.add_argument("--no-cache", action="store_true", help="embed every chunk, ignoring the cache")
+    parser.add_argument("--raw", action="store_true", help="skip citation-marker normalization")
+    parser.add_argument("--trace", action="store_true", help="print a per-stage timing breakdown")
+    args = parser.parse_args()
+    if args.trace:
+        enable()
+
+    backend = FakeEmbedder(latency=args.latency) if args.fake else OpenAIEmbedder()
+    embedder = BatchEmbedder(backend, max_batch_tokens=args.batch_tokens,
+                             max_batch_size=args.batch_size, max_concurrency=args.concurrency)
+
+    start = time.perf_counter()
+    raw = list(all_chunks)
+    normalized = list(normalize_chunks(raw))
+    chunks, other = (raw, normalized) if args.raw else (normalized, raw)
+    if args.no_cache:
+        matrix = embedder([chunk["text"] for chunk in chunks])
+    else:
+        cache = EmbeddingCache(args.cache) if args.cache else EmbeddingCache()
+        # Raw and normalized builds share the cache; pruning keeps both.
+        matrix = embed_chunks(embedder, chunks, cache=cache, prune=True,
+                              keep=[chunk_key(chunk) for chunk in other])
+    elapsed = time.perf_counter() - start
+    print(f"Embedded {matrix.shape[0]} chunks in {elapsed:.3f}s")
+    if args.trace:
+        dump()
+
+
+if __name__ == "__main__":
+    main()
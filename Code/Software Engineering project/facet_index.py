@@ -0,0 +1,142 @@
+# facet_index.py
+
+"""Bitmap index over chunk metadata for pre-filtering searches.
+
+Every value of ``metadata.topic``, ``metadata.source`` and the chunk set a
+chunk was declared in ("nursing_bsn_chunks", ...) maps to an integer bitmap
+whose bit ``i`` is set when the chunk at position ``i`` carries that value,
+the same representation prerequisites.py uses for course sets. Filters are
+plain ``&``/``|`` on those integers, so a scoped query resolves to the
+matching positions before any vector math; ``VectorIndex`` and ``HNSWIndex``
+search only that slice.
+"""
+
+import numpy as np
+
+from data_chunks import ALL_CHUNK_SETS, get_chunk_set
+
+FACETS = ("topic", "source", "chunk_set")
+
+
+def value_set(value):
+    """A filter argument as a set: None stays None, a string becomes ``{string}``."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
+def chunk_set_membership(chunk_sets=ALL_CHUNK_SETS):
+    """Map each chunk id in ``chunk_sets`` to the name of the set declaring it."""
+    return {chunk["id"]: name for name in chunk_sets for chunk in get_chunk_set(name)}
+
+
+class FacetIndex:
+    """Per-value bitmaps of chunk positions for the ``FACETS`` fields.
+
+    ``membership`` maps chunk ids to chunk-set names and defaults to the
+    published sets. Re-chunked chunks are assigned the set of their first
+    ``metadata["source_ids"]`` entry.
+    """
+
+    def __init__(self, chunks=(), membership=None):
+        self.membership = chunk_set_membership() if membership is None else membership
+        self._bitmaps = {facet: {} for facet in FACETS}
+        self._size = 0
+        positions = {facet: {} for facet in FACETS}
+        for chunk in chunks:
+            for facet, value in self._values(chunk).items():
+                positions[facet].setdefault(value, []).append(self._size)
+            self._size += 1
+        for facet, values in positions.items():
+            for value, rows in values.items():
+                bits = np.zeros(self._size, dtype=bool)
+                bits[rows] = True
+                packed = np.packbits(bits, bitorder="little").tobytes()
+                self._bitmaps[facet][value] = int.from_bytes(packed, "little")
+
+    def _values(self, chunk):
+        metadata = chunk.get("metadata", {})
+        values = {facet: metadata[facet] for facet in ("topic", "source") if facet in metadata}
+        chunk_id = metadata.get("source_ids", [chunk["id"]])[0]
+        if chunk_id in self.membership:
+            values["chunk_set"] = self.membership[chunk_id]
+        return values
+
+    def __len__(self):
+        return self._size
+
+    def state(self):
+        """Return ``(keys, bits)`` for ``from_state``.
+
+        ``keys`` lists ``[facet, value]`` pairs and row ``i`` of the uint8
+        array ``bits`` is the little-endian packed bitmap of ``keys[i]``.
+        Bytes rather than ints keep large bitmaps out of int/str conversion
+        limits when saving.
+        """
+        width = (self._size + 7) // 8
+        keys = [[facet, value] for facet in FACETS for value in self._bitmaps[facet]]
+        bits = np.zeros((len(keys), width), dtype=np.uint8)
+        for row, (facet, value) in enumerate(keys):
+            bits[row] = np.frombuffer(self._bitmaps[facet][value].to_bytes(width, "little"), dtype=np.uint8)
+        return keys, bits
+
+    @classmethod
+    def from_state(cls, keys, bits, size, membership=None):
+        """Rebuild an index from ``state()`` over ``size`` positions.
+
+        The bitmaps are restored as saved, so the result filters exactly like
+        the original; ``membership`` is only used for chunks added later.
+        """
+        index = cls(membership=membership)
+        for (facet, value), row in zip(keys, bits):
+            index._bitmaps[facet][value] = int.from_bytes(row.tobytes(), "little")
+        index._size = size
+        return index
+
+    def add(self, chunk):
+        """Append one chunk at the next position."""
+        for facet, value in self._values(chunk).items():
+            self._bitmaps[facet][value] = self._bitmaps[facet].get(value, 0) | 1 << self._size
+        self._size += 1
+
+    def values(self, facet):
+        return sorted(self._bitmaps[facet])
+
+    @property
+    def all(self):
+        return (1 << self._size) - 1
+
+    def match(self, facet, values):
+        """Bitmap of chunks whose ``facet`` is any of ``values`` (OR)."""
+        bitmaps = self._bitmaps[facet]
+        bitmap = 0
+        for value in value_set(values):
+            bitmap |= bitmaps.get(value, 0)
+        return bitmap
+
+    def select(self, **filters):
+        """Bitmap for ``facet=value(s)`` keyword filters, ANDed; None without filters.
+
+        ``select(topic="Nursing", source={"a", "b"})`` keeps Nursing chunks
+        from either source. Filters set to None are ignored.
+        """
+        bitmap = None
+        for facet, values in filters.items():
+            if facet not in self._bitmaps:
+                raise ValueError(f"unknown facet {facet!r}; expected one of {FACETS}")
+            if values is None:
+                continue
+            clause = self.match(facet, values)
+            bitmap = clause if bitmap is None else bitmap & clause
+        return bitmap
+
+    def mask(self, bitmap):
+        """Boolean array over positions for ``bitmap``."""
+        packed = np.frombuffer(bitmap.to_bytes((self._size + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(packed, count=self._size, bitorder="little").astype(bool)
+
+    def positions(self, bitmap):
+        """Sorted positions set in ``bitmap``."""
+        return np.flatnonzero(self.mask(bitmap))
@@ -0,0 +1,53 @@
+# golden_queries.py
+
+"""Golden query set for the retrieval benchmark.
+
+Each entry pairs a student-style question with the ids of the chunks that
+answer it; any of them counts as a hit for MRR and recall counts how many of
+them were retrieved. Ids refer to every declared chunk set in data_chunks.py,
+not only the published ones. Keep entries in sync when chunk ids change
+(``python retrieval_benchmark.py --check`` lists unknown ids).
+"""
+
+GOLDEN_QUERIES = [
+    # Computer Science
+    {"query": "prerequisite for MATH 2212", "relevant": ["cs_prereq_math2211_1", "cs_prereq_math2212_1"]},
+    {"query": "What do I need before taking CSC 2720 Data Structures?", "relevant": ["cs_prereq_csc2720_1"]},
+    {"query": "prerequisites for Software Engineering CSC 4350", "relevant": ["cs_prereq_csc4350_1"]},
+    {"query": "How many credit hours is the computer science degree?", "relevant": ["cs_four_year_plan_overview", "cs_degree_req_1"]},
+    {"query": "What courses do CS students take in the first year?", "relevant": ["cs_four_year_plan_first_year"]},
+    {"query": "requirements to enroll in major-level CSC courses", "relevant": ["cs_major_eligibility"]},
+    {"query": "Who do I contact about computer science admissions?", "relevant": ["cs_contact_admissions"]},
+    {"query": "GPA needed for the CS dual BS/MS degree", "relevant": ["dual_app_req_3", "dual_additional_3"]},
+    {"query": "How do dual degree students register for graduate courses?", "relevant": ["dual_grad_registration_1", "dual_grad_registration_4"]},
+    {"query": "cybersecurity certificate credit hours", "relevant": ["cert_cyber_3"]},
+    {"query": "data science certificate courses", "relevant": ["cert_ds_3"]},
+    {"query": "GPA to enroll in Data Science DSCI courses", "relevant": ["ds_chunk_4"]},
+    {"query": "CSC 4520 Analysis of Algorithms prerequisites", "relevant": ["cs_prereq_csc4520_1"]},
+    # Career services
+    {"query": "Where is the University Career Services office?", "relevant": ["career_services_7"]},
+    {"query": "free professional headshots", "relevant": ["career_services_iris_1"]},
+    {"query": "How do I find an internship on Handshake?", "relevant": ["career_services_5"]},
+    # Robinson College of Business
+    {"query": "GPA requirement for upper-level business courses", "relevant": ["rcb_admission_gpa_requirements", "rcb_continuing_eligibility"]},
+    {"query": "What is the Junior Business Core?", "relevant": ["rcb_junior_business_core"]},
+    {"query": "accounting major required courses", "relevant": ["acct_bba_major_courses"]},
+    {"query": "Who is the accounting program director?", "relevant": ["acct_web_contact"]},
+    {"query": "actuarial science program advisor", "relevant": ["as_bba_contact"]},
+    {"query": "CIS concentrations", "relevant": ["cis_bba_concentrations"]},
+    {"query": "finance honors track", "relevant": ["finance_bba_honors_track"]},
+    {"query": "hospitality industry certifications", "relevant": ["hadm_bba_highlights_certs"]},
+    {"query": "management concentrations", "relevant": ["mgt_bba_concentrations"]},
+    {"query": "professional sales certificate for marketing majors", "relevant": ["mkt_bba_highlights"]},
+    {"query": "risk management and insurance tracks", "relevant": ["rmi_bba_tracks_highlights"]},
+    {"query": "real estate department contact", "relevant": ["re_bba_contact"]},
+    {"query": "What is the PACE program?", "relevant": ["sig_prog_pace"]},
+    {"query": "LaunchGSU student incubator", "relevant": ["eni_bba_highlights"]},
+    # Nursing
+    {"query": "RN to BSN GPA", "relevant": ["rn_bsn_admissions_criteria"]},
+    {"query": "nursing prerequisite courses", "relevant": ["nursing_prerequisite_courses"]},
+    {"query": "How do I apply to the nursing major?", "relevant": ["nursing_admission_eligibility"]},
+    {"query": "How many hours is the nursing major curriculum?", "relevant": ["nursing_major_courses"]},
+    {"query": "School of Nursing phone number", "relevant": ["nursing_contact"]},
+    {"query": "RN-BSN program contact", "relevant": ["rn_bsn_contact"]},
+]
@@ -0,0 +1,317 @@
+# hnsw_index.py
+
+"""Hierarchical Navigable Small World (HNSW) approximate vector index.
+
+``VectorIndex`` scans every row, which stays cheap for a few hundred chunks
+but grows linearly with the corpus. ``HNSWIndex`` links chunks into a layered
+proximity graph (Malkov & Yashunin, 2016): a query descends greedily through
+the sparse upper layers and runs a best-first search of width ``ef`` on the
+bottom layer, touching roughly ``O(log n)`` nodes. ``M`` bounds the links per
+node (``2 * M`` on the bottom layer); larger ``M``/``ef`` trade speed for
+recall.
+
+Chunks can be added one at a time, and ``save``/``load`` keep the graph in a
+single .npz file, so a rebuild only inserts what is new.
+``python hnsw_index.py check`` round-trips a synthetic index (15,500 chunks
+by default) through ``save``/``load`` and compares facets and results. ``search`` has the
+same signature and result shape as ``VectorIndex.search``.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+
+import numpy as np
+
+from data_chunks import all_chunks
+from facet_index import FacetIndex
+from instrumentation import traced
+from vector_index import normalize_vector
+
+
+class HNSWIndex:
+    """Approximate cosine index built incrementally over chunk embeddings."""
+
+    def __init__(self, dimension, M=16, ef_construction=200, ef=50, seed=1, membership=None):
+        self.dimension = dimension
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef = ef
+        self.ids = []
+        self.texts = []
+        self.sources = []
+        self.topics = []
+        self._vectors = np.empty((16, dimension), dtype=np.float32)
+        self._links = []  # node -> [level 0 neighbours, level 1 neighbours, ...]
+        self._positions = {}
+        self._entry = None
+        self._level_scale = 1.0 / math.log(M)
+        self._rng = np.random.default_rng(seed)
+        self.facets = FacetIndex(membership=membership)
+
+    @classmethod
+    def from_chunks(cls, embed, chunks=None, **options):
+        """Build an index by calling ``embed(list_of_texts)`` once for the corpus."""
+        chunks = list(all_chunks if chunks is None else chunks)
+        embeddings = np.asarray(embed([chunk["text"] for chunk in chunks]), dtype=np.float32)
+        index = cls(embeddings.shape[1], **options)
+        index.add_items(chunks, embeddings)
+        return index
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, chunk_id):
+        return chunk_id in self._positions
+
+    def _similarities(self, query, nodes):
+        return self._vectors[nodes] @ query
+
+    def _search_layer(self, query, entry_points, ef, level, allowed=None):
+        """Best-first search of one layer; returns ``[(similarity, node)]``, best first.
+
+        With ``allowed`` the graph is still traversed through every node but
+        only allowed nodes are collected as results.
+        """
+        visited = set(entry_points)
+        sims = self._similarities(query, entry_points)
+        candidates = [(-float(s), node) for s, node in zip(sims, entry_points)]
+        heapq.heapify(candidates)
+        results = [(float(s), node) for s, node in zip(sims, entry_points)
+                   if allowed is None or allowed[node]]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            negative, node = heapq.heappop(candidates)
+            if len(results) >= ef and -negative < results[0][0]:
+                break
+            neighbours = [n for n in self._links[node][level] if n not in visited]
+            if not neighbours:
+                continue
+            visited.update(neighbours)
+            for similarity, neighbour in zip(self._similarities(query, neighbours).tolist(), neighbours):
+                if len(results) < ef or similarity > results[0][0]:
+                    heapq.heappush(candidates, (-similarity, neighbour))
+                    if allowed is None or allowed[neighbour]:
+                        heapq.heappush(results, (similarity, neighbour))
+                        if len(results) > ef:
+                            heapq.heappop(results)
+        return sorted(results, reverse=True)
+
+    def _select_neighbours(self, candidates, limit):
+        """Keep candidates closer to the new node than to any neighbour already kept."""
+        selected = []
+        for similarity, node in candidates:
+            if len(selected) >= limit:
+                break
+            if selected:
+                to_selected = self._similarities(self._vectors[node], selected)
+                if float(to_selected.max()) > similarity:
+                    continue
+            selected.append(node)
+        return selected
+
+    def _max_links(self, level):
+        return 2 * self.M if level == 0 else self.M
+
+    def add(self, chunk, vector):
+        """Insert one chunk with its embedding."""
+        chunk_id = chunk["id"]
+        if chunk_id in self._positions:
+            raise ValueError(f"chunk {chunk_id!r} is already indexed")
+        vector = normalize_vector(vector)
+        if vector.shape[0] != self.dimension:
+            raise ValueError(f"vector has dimension {vector.shape[0]}, index has {self.dimension}")
+
+        node = len(self.ids)
+        if node == self._vectors.shape[0]:
+            grown = np.empty((2 * node, self.dimension), dtype=np.float32)
+            grown[:node] = self._vectors
+            self._vectors = grown
+        self._vectors[node] = vector
+        self.ids.append(chunk_id)
+        self.texts.append(chunk["text"])
+        self.sources.append(chunk.get("metadata", {}).get("source", ""))
+        self.topics.append(chunk.get("metadata", {}).get("topic", ""))
+        self._positions[chunk_id] = node
+        self.facets.add(chunk)
+
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_scale)
+        self._links.append([[] for _ in range(level + 1)])
+        if self._entry is None:
+            self._entry = node
+            return
+
+        entry_points = [self._entry]
+        top = len(self._links[self._entry]) - 1
+        for layer in range(top, level, -1):
+            entry_points = [self._search_layer(vector, entry_points, 1, layer)[0][1]]
+        for layer in range(min(level, top), -1, -1):
+            found = self._search_layer(vector, entry_points, self.ef_construction, layer)
+            neighbours = self._select_neighbours(found, self.M)
+            self._links[node][layer] = neighbours
+            limit = self._max_links(layer)
+            for neighbour in neighbours:
+                links = self._links[neighbour][layer]
+                links.append(node)
+                if len(links) > limit:
+                    sims = self._similarities(self._vectors[neighbour], links)
+                    ranked = sorted(zip(sims.tolist(), links), reverse=True)
+                    self._links[neighbour][layer] = self._select_neighbours(ranked, limit)
+            entry_points = [n for _, n in found]
+        if level > top:
+            self._entry = node
+
+    def add_items(self, chunks, embeddings):
+        """Insert ``chunks`` with their rows of ``embeddings``, in order."""
+        for chunk, vector in zip(chunks, embeddings):
+            self.add(chunk, vector)
+
+    @traced("search.hnsw")
+    def search(self, query_vector, top_k=3, topic=None, source=None, chunk_set=None, where=None, ef=None):
+        """Return about the ``top_k`` chunks most similar to ``query_vector``.
+
+        The filters behave like ``VectorIndex.search``; ``ef`` overrides the
+        search width for this query.
+        """
+        query = normalize_vector(query_vector)
+        if query.shape[0] != self.dimension:
+            raise ValueError(f"query has dimension {query.shape[0]}, index has {self.dimension}")
+        if self._entry is None or top_k <= 0:
+            return []
+        bitmap = self.facets.select(topic=topic, source=source, chunk_set=chunk_set)
+        if where is not None:
+            bitmap = where if bitmap is None else bitmap & where
+        if bitmap == 0:
+            return []
+        allowed = None if bitmap is None else self.facets.mask(bitmap)
+
+        entry_points = [self._entry]
+        for layer in range(len(self._links[self._entry]) - 1, 0, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, layer)[0][1]]
+        found = self._search_layer(query, entry_points, max(ef or self.ef, top_k), 0, allowed)
+        return [self._result(node, similarity) for similarity, node in found[:top_k]]
+
+    def _result(self, node, score):
+        return {
+            "id": self.ids[node],
+            "score": score,
+            "text": self.texts[node],
+            "source": self.sources[node],
+            "topic": self.topics[node],
+        }
+
+    def save(self, path):
+        """Write the graph, vectors, chunk fields and facet bitmaps to ``path`` (.npz) atomically."""
+        levels = np.array([len(links) for links in self._links], dtype=np.int32)
+        counts = np.array([len(level) for links in self._links for level in links], dtype=np.int32)
+        targets = np.array([n for links in self._links for level in links for n in level], dtype=np.int32)
+        params = {"M": self.M, "ef_construction": self.ef_construction, "ef": self.ef,
+                  "entry": -1 if self._entry is None else self._entry}
+        facet_keys, facet_bits = self.facets.state()
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            params=np.array(json.dumps(params)),
+            vectors=self._vectors[:len(self.ids)],
+            levels=levels,
+            counts=counts,
+            targets=targets,
+            chunk_fields=np.array(json.dumps([self.ids, self.texts, self.sources, self.topics])),
+            facet_keys=np.array(json.dumps(facet_keys)),
+            facet_bits=facet_bits,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, seed=1, membership=None):
+        """Read an index written by ``save``; it can keep growing with ``add``.
+
+        The saved facet bitmaps are restored as they were; ``membership``
+        only assigns chunk sets to chunks added afterwards.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            params = json.loads(str(data["params"]))
+            vectors = data["vectors"]
+            levels = data["levels"]
+            counts = data["counts"]
+            targets = data["targets"]
+            ids, texts, sources, topics = json.loads(str(data["chunk_fields"]))
+            facet_keys = json.loads(str(data["facet_keys"]))
+            facet_bits = data["facet_bits"]
+
+        index = cls(vectors.shape[1], params["M"], params["ef_construction"], params["ef"], seed, membership)
+        index._vectors = np.array(vectors, dtype=np.float32, copy=True)
+        if index._vectors.shape[0] == 0:
+            index._vectors = np.empty((16, index.dimension), dtype=np.float32)
+        index.ids, index.texts, index.sources, index.topics = ids, texts, sources, topics
+        index._positions = {chunk_id: node for node, chunk_id in enumerate(ids)}
+        index.facets = FacetIndex.from_state(facet_keys, facet_bits, len(ids), index.facets.membership)
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        targets = targets.tolist()
+        slot = 0
+        for level_count in levels.tolist():
+            node_links = []
+            for _ in range(level_count):
+                node_links.append(targets[bounds[slot]:bounds[slot + 1]])
+                slot += 1
+            index._links.append(node_links)
+        index._entry = None if params["entry"] < 0 else params["entry"]
+        return index
+
+
+def roundtrip_check(size=15500, dimension=8, seed=0):
+    """Save and reload a synthetic ``size``-chunk index; return a list of mismatches.
+
+    Every chunk shares one topic, so that facet's bitmap spans the whole
+    index, and one chunk has no source.
+    """
+    import tempfile
+
+    rng = np.random.default_rng(seed)
+    chunks = [{"id": f"chunk_{i}", "text": "", "metadata": {"topic": "Shared", "source": f"source_{i % 3}"}}
+              for i in range(size)]
+    del chunks[0]["metadata"]["source"]
+    index = HNSWIndex(dimension, M=4, ef_construction=8, seed=seed, membership={})
+    index.add_items(chunks, rng.normal(size=(size, dimension)).astype(np.float32))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.npz")
+        index.save(path)
+        loaded = HNSWIndex.load(path, seed=seed, membership={})
+
+    problems = []
+    if len(loaded) != len(index):
+        problems.append(f"{len(loaded)} chunks loaded, {len(index)} saved")
+    for facet in ("topic", "source", "chunk_set"):
+        if loaded.facets.values(facet) != index.facets.values(facet):
+            problems.append(f"{facet} values differ")
+        elif any(loaded.facets.match(facet, value) != index.facets.match(facet, value)
+                 for value in index.facets.values(facet)):
+            problems.append(f"{facet} bitmaps differ")
+    query = rng.normal(size=dimension)
+    for filters in ({}, {"topic": "Shared"}, {"source": "source_1"}):
+        expected = [result["id"] for result in index.search(query, 10, **filters)]
+        if [result["id"] for result in loaded.search(query, 10, **filters)] != expected:
+            problems.append(f"search results differ for {filters or 'no filter'}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check HNSWIndex save/load on a synthetic index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="round-trip a synthetic index through save and load")
+    check.add_argument("--size", type=int, default=15500, help="number of synthetic chunks")
+    args = parser.parse_args()
+
+    problems = roundtrip_check(args.size)
+    if problems:
+        parser.exit(1, "\n".join(problems) + "\n")
+    print(f"Saved and reloaded {args.size} chunks: facets and results match.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# hybrid_search.py
+
+"""Hybrid lexical + dense retrieval fused with reciprocal rank fusion.
+
+The dense ranker (query embedding + ``VectorIndex``) and the lexical ranker
+(``BM25Index``) run concurrently; their candidate lists are merged with RRF,
+``score = sum(1 / (rrf_k + rank))``, which needs no score calibration between
+the two. Every result carries both rankers' scores and ranks, and every
+search reports how long each stage took.
+
+Query embeddings go through a ``CachedQueryEmbedder`` (see query_cache.py),
+so repeated questions skip the embeddings call; pass ``query_cache_bytes=0``
+to disable it.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import traced
+from query_cache import QUERY_CACHE_BYTES, CachedQueryEmbedder
+
+RRF_K = 60
+
+
+def _elapsed_ms(start):
+    return (time.perf_counter() - start) * 1000.0
+
+
+class HybridRetriever:
+    """Runs dense and lexical retrieval in parallel and fuses the rankings.
+
+    ``embed_query`` maps a query string to a vector in the same space as
+    ``vector_index``. Both indexes should be built over the same chunks.
+    """
+
+    def __init__(self, vector_index, bm25_index, embed_query, rrf_k=RRF_K, candidates=50,
+                 query_cache_bytes=QUERY_CACHE_BYTES):
+        self.vector_index = vector_index
+        self.bm25_index = bm25_index
+        if query_cache_bytes and not isinstance(embed_query, CachedQueryEmbedder):
+            embed_query = CachedQueryEmbedder(embed_query, query_cache_bytes)
+        self.embed_query = embed_query
+        self.rrf_k = rrf_k
+        self.candidates = candidates
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _dense(self, query, timings):
+        start = time.perf_counter()
+        vector = self.embed_query(query)
+        timings["embed_ms"] = _elapsed_ms(start)
+        start = time.perf_counter()
+        results = self.vector_index.search(vector, top_k=self.candidates)
+        timings["dense_ms"] = _elapsed_ms(start)
+        return results
+
+    def _lexical(self, query, timings):
+        start = time.perf_counter()
+        results = self.bm25_index.search(query, top_k=self.candidates)
+        timings["lexical_ms"] = _elapsed_ms(start)
+        return results
+
+    @traced("query.hybrid")
+    def search(self, query, top_k=3):
+        """Return ``{"results": [...], "timings": {...}}`` for ``query``.
+
+        Each result has the usual id/score/text/source/topic fields, where
+        ``score`` is the fused RRF score, plus ``dense_score``/``dense_rank``
+        and ``lexical_score``/``lexical_rank`` (None when that ranker did not
+        return the chunk). Timings are in milliseconds.
+        """
+        timings = {}
+        total_start = time.perf_counter()
+        dense_future = self._pool.submit(self._dense, query, timings)
+        lexical_future = self._pool.submit(self._lexical, query, timings)
+        dense, lexical = dense_future.result(), lexical_future.result()
+
+        start = time.perf_counter()
+        fused = {}
+        for name, ranking in (("dense", dense), ("lexical", lexical)):
+            for rank, hit in enumerate(ranking, start=1):
+                entry = fused.get(hit["id"])
+                if entry is None:
+                    entry = fused[hit["id"]] = {
+                        "id": hit["id"],
+                        "score": 0.0,
+                        "text": hit["text"],
+                        "source": hit["source"],
+                        "topic": hit["topic"],
+                        "dense_score": None,
+                        "dense_rank": None,
+                        "lexical_score": None,
+                        "lexical_rank": None,
+                    }
+                entry["score"] += 1.0 / (self.rrf_k + rank)
+                entry[f"{name}_score"] = hit["score"]
+                entry[f"{name}_rank"] = rank
+        results = sorted(fused.values(), key=lambda entry: -entry["score"])[:top_k]
+        timings["fusion_ms"] = _elapsed_ms(start)
+        timings["total_ms"] = _elapsed_ms(total_start)
+        return {"results": results, "timings": timings}
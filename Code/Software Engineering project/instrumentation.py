@@ -0,0 +1,186 @@
+# instrumentation.py
+
+"""Lightweight per-stage timing for the build and query paths.
+
+Stages are wrapped in named spans (``with span("search.dense"):`` or the
+``@traced("search.dense")`` decorator) and events are tallied with
+``count``. Span durations come from the monotonic
+``perf_counter_ns`` clock and go into HDR-style histograms: log-linear
+buckets with 64 linear steps per power of two, so percentiles stay within
+about 1% at any scale in constant memory per stage.
+
+Instrumentation is off unless ``enable()`` is called or ``PIPELINE_TRACE=1``
+is set. While off, ``span`` returns a shared no-op context manager and
+``count`` returns at once, so the calls can stay in hot paths. ``dump()``
+prints the per-stage breakdown; the build CLIs take ``--trace`` to do so.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+
+_SUB_BITS = 7
+_HALF = 1 << (_SUB_BITS - 1)
+
+_enabled = os.environ.get("PIPELINE_TRACE", "") not in ("", "0")
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+
+
+class Histogram:
+    """Log-linear histogram of non-negative integer values (nanoseconds)."""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    @staticmethod
+    def _index(value):
+        shift = value.bit_length() - _SUB_BITS
+        if shift <= 0:
+            return value
+        return shift * _HALF + (value >> shift)
+
+    @staticmethod
+    def _midpoint(index):
+        if index < 2 * _HALF:
+            return index
+        shift = index // _HALF - 1
+        return ((index - shift * _HALF) << shift) + (1 << (shift - 1))
+
+    def record(self, value):
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(self._midpoint(index), self.min), self.max)
+        return self.max
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter_ns() - self.start
+        with _lock:
+            histogram = _histograms.get(self.name)
+            if histogram is None:
+                histogram = _histograms[self.name] = Histogram()
+            histogram.record(elapsed)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def enabled():
+    return _enabled
+
+
+def span(name):
+    """Context manager timing one occurrence of stage ``name``."""
+    return _Span(name) if _enabled else _NO_SPAN
+
+
+def traced(name):
+    """Decorator timing every call of the wrapped function as stage ``name``."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, amount=1):
+    """Add ``amount`` to counter ``name``."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def report():
+    """Snapshot as ``{"spans": {name: stats_ms}, "counters": {name: n}}``."""
+    with _lock:
+        spans = {}
+        for name, histogram in _histograms.items():
+            spans[name] = {
+                "count": histogram.count,
+                "total_ms": histogram.total / 1e6,
+                "mean_ms": histogram.total / histogram.count / 1e6,
+                "p50_ms": histogram.percentile(50) / 1e6,
+                "p95_ms": histogram.percentile(95) / 1e6,
+                "p99_ms": histogram.percentile(99) / 1e6,
+                "max_ms": histogram.max / 1e6,
+            }
+        return {"spans": spans, "counters": dict(_counters)}
+
+
+def dump(file=None):
+    """Print the per-stage breakdown, slowest total first."""
+    file = sys.stderr if file is None else file
+    snapshot = report()
+    columns = ("count", "total_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+    print(f"{'stage':<24}" + "".join(f"{column:>11}" for column in columns), file=file)
+    for name, stats in sorted(snapshot["spans"].items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"{name:<24}{stats['count']:>11}"
+              + "".join(f"{stats[column]:>11.3f}" for column in columns[1:]), file=file)
+    for name, value in sorted(snapshot["counters"].items()):
+        print(f"{name:<24}{value:>11}", file=file)
@@ -0,0 +1,177 @@
+# near_duplicates.py
+
+"""MinHash/LSH near-duplicate detection across the corpus.
+
+Each chunk's text is reduced to a set of word shingles and summarised by a
+MinHash signature; the fraction of equal signature slots estimates the
+Jaccard similarity of two chunks. Signatures are cut into bands and hashed
+into buckets (locality-sensitive hashing), so only chunks that share a bucket
+are compared and the whole corpus is clustered in roughly linear time.
+
+The build can then ``collapse`` each cluster to its first chunk or ``link``
+duplicates to it through ``metadata["duplicate_of"]`` (the artifact build
+and NDJSON export take ``--dedupe``). Year-plan chunks of different majors
+cluster together while still naming their own major, so ``link`` is the safe
+choice unless the cluster members are known to be interchangeable. Run
+``python near_duplicates.py`` to list the clusters.
+"""
+
+import argparse
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from data_chunks import all_chunks, every_chunk
+from instrumentation import traced
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD_RE = re.compile(r"\w+")
+
+DEDUPE_MODES = ("collapse", "link")
+
+
+def _optimal_bands(num_perm, threshold):
+    """Pick (bands, rows) whose S-curve crosses ``threshold`` most closely."""
+    best = None
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        crossing = (1.0 / bands) ** (1.0 / rows)
+        error = abs(crossing - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateDetector:
+    """Clusters chunks whose estimated Jaccard similarity reaches ``threshold``."""
+
+    def __init__(self, threshold=0.7, num_perm=128, shingle_size=3, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.bands, self.rows = _optimal_bands(num_perm, threshold)
+
+    def shingles(self, text):
+        words = _WORD_RE.findall(text.lower())
+        size = min(self.shingle_size, len(words)) or 1
+        return {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+
+    def signature(self, text):
+        """MinHash signature of ``text`` as a uint64 array of length ``num_perm``."""
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in self.shingles(text)),
+                             dtype=np.uint64)
+        # Universal hashing (a*x + b) mod p; uint64 overflow wraps, as in datasketch.
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def find_clusters(self, chunks=None):
+        """Return clusters of near-duplicate chunk ids, each in corpus order.
+
+        Only clusters with at least two members are returned; the first id of
+        each cluster is its representative.
+        """
+        chunks = list(all_chunks if chunks is None else chunks)
+        if not chunks:
+            return []
+        signatures = np.stack([self.signature(chunk["text"]) for chunk in chunks])
+
+        candidates = set()
+        for band in range(self.bands):
+            columns = signatures[:, band * self.rows:(band + 1) * self.rows]
+            buckets = defaultdict(list)
+            for position, row in enumerate(columns):
+                buckets[row.tobytes()].append(position)
+            for members in buckets.values():
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        candidates.add((first, second))
+
+        parent = list(range(len(chunks)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for first, second in candidates:
+            similarity = float(np.mean(signatures[first] == signatures[second]))
+            if similarity >= self.threshold:
+                root_a, root_b = find(first), find(second)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        clusters = defaultdict(list)
+        for position in range(len(chunks)):
+            clusters[find(position)].append(chunks[position]["id"])
+        return [ids for _, ids in sorted(clusters.items()) if len(ids) > 1]
+
+
+def dedupe_chunks(chunks, clusters, mode="collapse"):
+    """Apply ``clusters`` to ``chunks`` and return the new chunk list.
+
+    ``collapse`` keeps only each cluster's representative and lists the
+    dropped ids in its ``metadata["duplicates"]``; ``link`` keeps every chunk
+    and sets ``metadata["duplicate_of"]`` on the non-representatives.
+    """
+    if mode not in DEDUPE_MODES:
+        raise ValueError(f"mode must be one of {DEDUPE_MODES}, not {mode!r}")
+    representative = {}
+    members = {}
+    for ids in clusters:
+        members[ids[0]] = ids[1:]
+        for duplicate in ids[1:]:
+            representative[duplicate] = ids[0]
+
+    result = []
+    for chunk in chunks:
+        chunk_id = chunk["id"]
+        if mode == "collapse":
+            if chunk_id in representative:
+                continue
+            if chunk_id in members:
+                chunk = dict(chunk, metadata=dict(chunk.get("metadata", {}), duplicates=members[chunk_id]))
+        elif chunk_id in representative:
+            chunk = dict(chunk, metadata=dict(chunk.get("metadata", {}),
+                                              duplicate_of=representative[chunk_id]))
+        result.append(chunk)
+    return result
+
+
+@traced("dedupe")
+def dedupe(chunks, mode="link", threshold=0.7):
+    """Detect near-duplicates in ``chunks`` and apply ``dedupe_chunks``."""
+    chunks = list(chunks)
+    clusters = NearDuplicateDetector(threshold).find_clusters(chunks)
+    return dedupe_chunks(chunks, clusters, mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List near-duplicate chunk clusters.")
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--every-set", action="store_true",
+                        help="scan every declared chunk set, not just the published ones")
+    args = parser.parse_args()
+
+    chunks = list(every_chunk if args.every_set else all_chunks)
+    detector = NearDuplicateDetector(args.threshold, args.num_perm)
+    clusters = detector.find_clusters(chunks)
+    for ids in clusters:
+        print(", ".join(ids))
+    duplicates = sum(len(ids) - 1 for ids in clusters)
+    print(f"{len(clusters)} clusters, {duplicates} of {len(chunks)} chunks are near-duplicates "
+          f"(bands={detector.bands}, rows={detector.rows})")
+
+
+if __name__ == "__main__":
+    main()
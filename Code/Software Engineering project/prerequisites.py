@@ -0,0 +1,198 @@
+# prerequisites.py
+
+"""Prerequisite DAG compiled from the CS prerequisite chart chunks.
+
+The chart chunks (``cs_prerequisite_chunks``) describe each course in
+prose: "Its prerequisites are CSC 1301 and MATH 1113. It is a prerequisite
+for CSC 2720 ... It can be taken concurrently with MATH 1113." This module
+parses those sentences into prerequisite and corequisite edges and
+precomputes the transitive closure as integer bitsets, so "everything I need
+before CSC 4330" and "what does CSC 1301 unlock" are answered with a couple
+of bit operations instead of an LLM call.
+"""
+
+import re
+
+from course_codes import find_course_codes, iter_course_codes
+from data_chunks import get_chunk_set
+
+# Each phrase introduces the courses that follow it, up to the next phrase.
+_PHRASES = re.compile(
+    r"(?P<requires>Its prerequisites? (?:is|are)|that require)"
+    r"|(?P<unlocks>(?:is|serves as) an? (?:required )?prerequisite for)"
+    r"|(?P<coreq>taken concurrently with)"
+    r"|(?P<shares>shares prerequisites with)",
+    re.IGNORECASE,
+)
+
+
+class PrerequisiteCycleError(ValueError):
+    """The parsed prerequisite edges do not form a DAG."""
+
+
+def parse_prerequisite_text(text):
+    """Split one chart chunk into its course and the courses each phrase names.
+
+    Returns ``(course, {"requires": [...], "unlocks": [...], "coreq": [...],
+    "shares": [...]})`` or ``(None, {})`` if the text names no course.
+    """
+    first = next(iter_course_codes(text), None)
+    if first is None:
+        return None, {}
+    relations = {"requires": [], "unlocks": [], "coreq": [], "shares": []}
+    matches = list(_PHRASES.finditer(text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        relations[match.lastgroup].extend(find_course_codes(text[match.end():end]))
+    return first[2], relations
+
+
+class PrerequisiteGraph:
+    """Directed prerequisite graph with bitset transitive closures.
+
+    Bit ``i`` of a bitset stands for ``self.courses[i]``; courses are kept in
+    topological order, so decoding a bitset lists prerequisites before the
+    courses that need them.
+    """
+
+    def __init__(self, edges, corequisites=(), sources=None):
+        nodes = set()
+        for before, after in edges:
+            nodes.update((before, after))
+        for a, b in corequisites:
+            nodes.update((a, b))
+
+        order = self._topological_order(nodes, edges)
+        self.courses = tuple(order)
+        self._index = {code: i for i, code in enumerate(order)}
+        self.sources = dict(sources or {})
+
+        n = len(order)
+        self._direct_prereqs = [0] * n
+        self._direct_unlocks = [0] * n
+        self._coreqs = [0] * n
+        for before, after in edges:
+            b, a = self._index[before], self._index[after]
+            self._direct_prereqs[a] |= 1 << b
+            self._direct_unlocks[b] |= 1 << a
+        for x, y in corequisites:
+            i, j = self._index[x], self._index[y]
+            self._coreqs[i] |= 1 << j
+            self._coreqs[j] |= 1 << i
+
+        # One pass in topological order (and one in reverse) closes the graph.
+        self._ancestors = [0] * n
+        for i in range(n):
+            closure = self._direct_prereqs[i]
+            for j in self._bits(self._direct_prereqs[i]):
+                closure |= self._ancestors[j]
+            self._ancestors[i] = closure
+        self._descendants = [0] * n
+        for i in reversed(range(n)):
+            closure = self._direct_unlocks[i]
+            for j in self._bits(self._direct_unlocks[i]):
+                closure |= self._descendants[j]
+            self._descendants[i] = closure
+
+    @staticmethod
+    def _topological_order(nodes, edges):
+        successors = {node: set() for node in nodes}
+        indegree = dict.fromkeys(nodes, 0)
+        for before, after in set(edges):
+            if after not in successors[before]:
+                successors[before].add(after)
+                indegree[after] += 1
+        ready = sorted(node for node, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for after in sorted(successors[node]):
+                indegree[after] -= 1
+                if indegree[after] == 0:
+                    ready.append(after)
+        if len(order) != len(nodes):
+            stuck = sorted(node for node, degree in indegree.items() if degree)
+            raise PrerequisiteCycleError(f"prerequisite cycle among {', '.join(stuck)}")
+        return order
+
+    @classmethod
+    def from_chunks(cls, chunks=None):
+        """Compile the graph from prerequisite chart chunks.
+
+        Defaults to the ``cs_prerequisite_chunks`` set, whether or not it is
+        published through ``all_chunks``.
+        """
+        if chunks is None:
+            chunks = get_chunk_set("cs_prerequisite_chunks")
+
+        edges, corequisites, shares, sources = set(), set(), [], {}
+        for chunk in chunks:
+            course, relations = parse_prerequisite_text(chunk["text"])
+            if course is None:
+                continue
+            sources.setdefault(course, chunk["id"])
+            edges.update((before, course) for before in relations["requires"] if before != course)
+            edges.update((course, after) for after in relations["unlocks"] if after != course)
+            corequisites.update(tuple(sorted((course, other)))
+                                for other in relations["coreq"] if other != course)
+            shares.extend((course, other) for other in relations["shares"])
+
+        # "It shares prerequisites with X" copies X's direct prerequisites.
+        for course, other in shares:
+            edges.update((before, course) for before, after in list(edges)
+                         if after == other and before != course)
+        return cls(edges, corequisites, sources)
+
+    def __len__(self):
+        return len(self.courses)
+
+    def __contains__(self, code):
+        return code in self._index
+
+    @staticmethod
+    def _bits(bitset):
+        while bitset:
+            low = bitset & -bitset
+            yield low.bit_length() - 1
+            bitset ^= low
+
+    def _decode(self, bitset):
+        return [self.courses[i] for i in self._bits(bitset)]
+
+    def _position(self, code):
+        try:
+            return self._index[code]
+        except KeyError:
+            raise KeyError(f"{code} is not in the prerequisite graph") from None
+
+    def mask(self, codes):
+        """Bitset of the known courses among ``codes``; unknown codes are ignored."""
+        bitset = 0
+        for code in codes:
+            i = self._index.get(code)
+            if i is not None:
+                bitset |= 1 << i
+        return bitset
+
+    def prerequisites(self, code, transitive=True):
+        """Courses that must come before ``code``, in topological order."""
+        i = self._position(code)
+        return self._decode(self._ancestors[i] if transitive else self._direct_prereqs[i])
+
+    def unlocks(self, code, transitive=True):
+        """Courses that ``code`` is a (transitive) prerequisite for."""
+        i = self._position(code)
+        return self._decode(self._descendants[i] if transitive else self._direct_unlocks[i])
+
+    def corequisites(self, code):
+        """Courses that may be taken concurrently with ``code``."""
+        return self._decode(self._coreqs[self._position(code)])
+
+    def requires(self, code, prerequisite):
+        """True if ``prerequisite`` is a direct or transitive prerequisite of ``code``."""
+        return bool(self._ancestors[self._position(code)] >> self._position(prerequisite) & 1)
+
+    def missing_prerequisites(self, code, completed):
+        """Transitive prerequisites of ``code`` not covered by ``completed``."""
+        return self._decode(self._ancestors[self._position(code)] & ~self.mask(completed))
@@ -0,0 +1,105 @@
+# program_router.py
+
+"""Routes a query to the one or two programs it is about.
+
+The corpus is partitioned by chunk set (finance_bba_chunks, rn_bsn_chunks,
+...). ``ProgramRouter`` precomputes, per partition, the centroid of its chunk
+embeddings and a keyword signature: the partition's most distinctive terms
+weighted by tf-idf across partitions. A query is scored against both signals,
+the scores are turned into a softmax distribution, and the search runs only
+over the top partition, or the top two when the first is not confident
+enough. When even two partitions fall below ``min_confidence`` the router
+falls back to a full search. Chunks outside every chunk set are only reached
+by the fallback.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+
+from bm25_index import tokenize
+from instrumentation import traced
+from vector_index import normalize_vector
+
+
+class ProgramRouter:
+    """Narrows ``VectorIndex`` searches to the partitions a query belongs to.
+
+    ``keyword_weight`` scales the keyword score (0..1) against the centroid
+    cosine, and ``temperature`` sets how peaked the routing distribution is.
+    """
+
+    def __init__(self, vector_index, keywords=25, keyword_weight=0.5, temperature=0.05,
+                 max_partitions=2, min_confidence=0.6):
+        self.vector_index = vector_index
+        self.keyword_weight = keyword_weight
+        self.temperature = temperature
+        self.max_partitions = max_partitions
+        self.min_confidence = min_confidence
+
+        facets = vector_index.facets
+        self.partitions = facets.values("chunk_set")
+        self.sizes = []
+        centroids = []
+        term_counts = []
+        for name in self.partitions:
+            positions = facets.positions(facets.match("chunk_set", name))
+            self.sizes.append(len(positions))
+            centroids.append(normalize_vector(vector_index.rows(positions).mean(axis=0)))
+            term_counts.append(Counter(term for row in positions
+                                       for term in tokenize(vector_index.texts[row])))
+        self.centroids = (np.stack(centroids) if centroids
+                          else np.empty((0, vector_index.dimension), dtype=np.float32))
+
+        document_frequency = Counter(term for counts in term_counts for term in counts)
+        self.signatures = []
+        for counts in term_counts:
+            total = sum(counts.values()) or 1
+            weights = {term: count / total * math.log(len(term_counts) / document_frequency[term])
+                       for term, count in counts.items()}
+            top = sorted(weights.items(), key=lambda item: -item[1])[:keywords]
+            norm = sum(weight for _, weight in top) or 1.0
+            self.signatures.append({term: weight / norm for term, weight in top if weight > 0})
+        self._subjects = frozenset(term.split(" ", 1)[0] for signature in self.signatures
+                                   for term in signature if " " in term)
+
+    def route(self, query, query_vector):
+        """Return ``[(partition, probability)]`` for every partition, most likely first."""
+        if not self.partitions:
+            return []
+        vector = normalize_vector(query_vector)
+        terms = set(tokenize(query, self._subjects))
+        keyword_scores = np.array([sum(weight for term, weight in signature.items() if term in terms)
+                                   for signature in self.signatures], dtype=np.float32)
+        scores = self.centroids @ vector + self.keyword_weight * keyword_scores
+        logits = (scores - scores.max()) / self.temperature
+        probabilities = np.exp(logits) / np.exp(logits).sum()
+        order = np.argsort(-probabilities)
+        return [(self.partitions[i], float(probabilities[i])) for i in order]
+
+    def select(self, query, query_vector):
+        """Partitions to search, or None when the router should fall back to a full search."""
+        selected, confidence = [], 0.0
+        for partition, probability in self.route(query, query_vector)[:self.max_partitions]:
+            selected.append(partition)
+            confidence += probability
+            if confidence >= self.min_confidence:
+                return selected
+        return None
+
+    @traced("query.routed")
+    def search(self, query, query_vector, top_k=3):
+        """Return ``{"results": [...], "partitions": [...] or None, "scanned": n}``.
+
+        ``partitions`` is None when the search fell back to the whole index;
+        ``scanned`` counts the rows that were scored.
+        """
+        partitions = self.select(query, query_vector)
+        if partitions is None:
+            results = self.vector_index.search(query_vector, top_k=top_k)
+            scanned = len(self.vector_index)
+        else:
+            results = self.vector_index.search(query_vector, top_k=top_k, chunk_set=partitions)
+            scanned = sum(self.sizes[self.partitions.index(name)] for name in partitions)
+        return {"results": results, "partitions": partitions, "scanned": scanned}
@@ -0,0 +1,79 @@
+# query_cache.py
+
+"""LRU cache of query embeddings.
+
+pineconeClient.getEmbedding calls the embeddings API for every message, even
+exact repeats. ``CachedQueryEmbedder`` wraps an ``embed_query`` callable and
+keys its results on the normalized query (case-folded, whitespace collapsed),
+so "What is the RN to BSN GPA?" and "what is the  rn to bsn gpa?" share one
+API call. Vectors are kept as float32 arrays and the least recently used ones
+are evicted once their total size passes ``max_bytes``.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from instrumentation import count
+
+QUERY_CACHE_BYTES = 8 * 1024 * 1024  # ~1365 text-embedding-3-small vectors
+
+
+def normalize_query(query):
+    return re.sub(r"\s+", " ", query).strip().casefold()
+
+
+class CachedQueryEmbedder:
+    """Callable ``embed_query(query)`` that memoizes ``embed_query`` by normalized query."""
+
+    def __init__(self, embed_query, max_bytes=QUERY_CACHE_BYTES):
+        self.embed_query = embed_query
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __call__(self, query):
+        key = normalize_query(query)
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+                self.hits += 1
+                count("query_cache.hits")
+                return vector
+            self.misses += 1
+            count("query_cache.misses")
+
+        vector = np.asarray(self.embed_query(query), dtype=np.float32).ravel()
+        vector.setflags(write=False)
+        with self._lock:
+            if key not in self._vectors and vector.nbytes <= self.max_bytes:
+                self._vectors[key] = vector
+                self.nbytes += vector.nbytes
+                while self.nbytes > self.max_bytes:
+                    _, evicted = self._vectors.popitem(last=False)
+                    self.nbytes -= evicted.nbytes
+        return vector
+
+    def clear(self):
+        with self._lock:
+            self._vectors.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._vectors),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,145 @@
+# rechunker.py
+
+"""Re-chunking of the corpus to a target token range.
+
+``chunks_structured`` holds dozens of one-line catalog rows ("CSC 1010 -
+Computers and Applications"), each costing its own vector and its own top-k
+slot, while some prose chunks run long. ``rechunk`` merges runs of adjacent
+chunks that share a topic and source until they reach ``min_tokens``, and
+splits chunks above ``max_tokens`` on sentence boundaries into balanced
+pieces. Every output chunk records the ids it came from in
+``metadata["source_ids"]``.
+
+Run ``python rechunker.py --every-set`` to see the effect on the full corpus.
+"""
+
+import argparse
+import math
+
+from data_chunks import all_chunks, every_chunk
+from instrumentation import traced
+from tokens import count_tokens, split_sentences
+
+MIN_TOKENS = 64
+MAX_TOKENS = 320
+
+# Per-chunk metadata that cannot simply be copied onto a merged or split chunk.
+_PER_CHUNK_KEYS = ("citations", "duplicates", "duplicate_of", "source_ids")
+
+
+def _group_key(chunk):
+    metadata = chunk.get("metadata", {})
+    return metadata.get("topic"), metadata.get("source")
+
+
+def _base_metadata(chunk):
+    return {key: value for key, value in chunk.get("metadata", {}).items() if key not in _PER_CHUNK_KEYS}
+
+
+def _source_ids(chunk):
+    return list(chunk.get("metadata", {}).get("source_ids", [chunk["id"]]))
+
+
+def _merge(group):
+    if len(group) == 1:
+        return group[0]
+    metadata = _base_metadata(group[0])
+    metadata["source_ids"] = [source_id for chunk in group for source_id in _source_ids(chunk)]
+    citations, offset = [], 0
+    for chunk in group:
+        for entry in chunk.get("metadata", {}).get("citations", []):
+            citations.append(dict(entry, sentence=entry["sentence"] + offset))
+        offset += len(split_sentences(chunk["text"]))
+    if citations:
+        metadata["citations"] = citations
+    return {
+        "id": f"{group[0]['id']}..{group[-1]['id']}",
+        "text": "\n".join(chunk["text"] for chunk in group),
+        "metadata": metadata,
+    }
+
+
+def _split(chunk, max_tokens):
+    sentences = split_sentences(chunk["text"])
+    counts = [count_tokens(sentence) for sentence in sentences]
+    total = sum(counts)
+    if total <= max_tokens or len(sentences) < 2:
+        return [chunk]
+
+    target = total / math.ceil(total / max_tokens)
+    pieces, current, current_tokens = [], [], 0
+    for index, tokens in enumerate(counts):
+        if current and (current_tokens + tokens > max_tokens or current_tokens >= target):
+            pieces.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    pieces.append(current)
+
+    citations = chunk.get("metadata", {}).get("citations", [])
+    result = []
+    for part, indices in enumerate(pieces, start=1):
+        metadata = _base_metadata(chunk)
+        metadata["source_ids"] = _source_ids(chunk)
+        first = indices[0]
+        cited = [dict(entry, sentence=entry["sentence"] - first)
+                 for entry in citations if first <= entry["sentence"] <= indices[-1]]
+        if cited:
+            metadata["citations"] = cited
+        result.append({
+            "id": f"{chunk['id']}#{part}",
+            "text": " ".join(sentences[i] for i in indices),
+            "metadata": metadata,
+        })
+    return result
+
+
+@traced("rechunk")
+def rechunk(chunks=None, min_tokens=MIN_TOKENS, max_tokens=MAX_TOKENS):
+    """Return the corpus regrouped so chunks fall within the token range where possible."""
+    chunks = all_chunks if chunks is None else chunks
+    merged, group, group_tokens = [], [], 0
+    for chunk in chunks:
+        tokens = count_tokens(chunk["text"])
+        if group and (_group_key(chunk) == _group_key(group[0])
+                      and group_tokens < min_tokens and group_tokens + tokens <= max_tokens):
+            group.append(chunk)
+            group_tokens += tokens
+            continue
+        if group:
+            merged.append(_merge(group))
+        group, group_tokens = [chunk], tokens
+    if group:
+        merged.append(_merge(group))
+
+    return [piece for chunk in merged for piece in _split(chunk, max_tokens)]
+
+
+def id_mapping(rechunked):
+    """Map each original chunk id to the ids of the re-chunked chunks containing it."""
+    mapping = {}
+    for chunk in rechunked:
+        for source_id in _source_ids(chunk):
+            mapping.setdefault(source_id, []).append(chunk["id"])
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report how re-chunking changes the corpus.")
+    parser.add_argument("--min-tokens", type=int, default=MIN_TOKENS)
+    parser.add_argument("--max-tokens", type=int, default=MAX_TOKENS)
+    parser.add_argument("--every-set", action="store_true",
+                        help="use every declared chunk set, not just the published ones")
+    args = parser.parse_args()
+
+    chunks = list(every_chunk if args.every_set else all_chunks)
+    result = rechunk(chunks, args.min_tokens, args.max_tokens)
+    for label, group in (("before", chunks), ("after", result)):
+        counts = sorted(count_tokens(chunk["text"]) for chunk in group)
+        if counts:
+            print(f"{label:>6}: {len(counts)} chunks, tokens min {counts[0]} / "
+                  f"median {counts[len(counts) // 2]} / max {counts[-1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# retrieval_benchmark.py
+
+"""Retrieval benchmark over the golden query set.
+
+Runs every query in golden_queries.py against each retrieval backend and
+reports recall@k, mean reciprocal rank and p50/p95/p99 search latency, so a
+performance change can be compared on the same footing as the baseline.
+Backends are built over every declared chunk set:
+
+    bm25        BM25Index
+    dense       VectorIndex
+    dense-int8  VectorIndex(quantize=True)
+    hnsw        HNSWIndex
+    hybrid      HybridRetriever over dense + bm25 (RRF)
+    routed      ProgramRouter over dense
+
+Query embeddings are computed once up front, so dense latencies measure
+search only; ``hybrid`` looks its embedding up in the same table.
+``python retrieval_benchmark.py --fake`` runs offline with random vectors,
+which gives meaningful latencies but not meaningful dense quality.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from data_chunks import every_chunk
+from golden_queries import GOLDEN_QUERIES
+from instrumentation import dump, enable
+
+BACKENDS = ("bm25", "dense", "dense-int8", "hnsw", "hybrid", "routed")
+DEFAULT_KS = (1, 3, 10)
+
+
+def unknown_ids(chunks, queries=GOLDEN_QUERIES):
+    """Relevant ids in ``queries`` that no chunk in ``chunks`` has."""
+    ids = {chunk["id"] for chunk in chunks}
+    return sorted({chunk_id for entry in queries for chunk_id in entry["relevant"] if chunk_id not in ids})
+
+
+def build_backends(chunks, embeddings, query_vectors, names=BACKENDS):
+    """Return ``{name: search(query, query_vector, top_k) -> [ids]}`` for ``names``."""
+    from bm25_index import BM25Index
+    from facet_index import chunk_set_membership
+    from vector_index import VectorIndex
+
+    membership = chunk_set_membership(every_chunk.names)
+    backends = {}
+    bm25 = BM25Index(chunks)
+    dense = VectorIndex(chunks, embeddings, membership=membership)
+
+    def ids(results):
+        return [result["id"] for result in results]
+
+    for name in names:
+        if name == "bm25":
+            backends[name] = lambda query, vector, top_k: ids(bm25.search(query, top_k))
+        elif name == "dense":
+            backends[name] = lambda query, vector, top_k: ids(dense.search(vector, top_k))
+        elif name == "dense-int8":
+            quantized = VectorIndex(chunks, embeddings, quantize=True, membership=membership)
+            backends[name] = lambda query, vector, top_k: ids(quantized.search(vector, top_k))
+        elif name == "hnsw":
+            from hnsw_index import HNSWIndex
+
+            hnsw = HNSWIndex(embeddings.shape[1], membership=membership)
+            hnsw.add_items(chunks, embeddings)
+            backends[name] = lambda query, vector, top_k: ids(hnsw.search(vector, top_k))
+        elif name == "hybrid":
+            from hybrid_search import HybridRetriever
+
+            hybrid = HybridRetriever(dense, bm25, query_vectors.__getitem__, query_cache_bytes=0)
+            backends[name] = lambda query, vector, top_k: ids(hybrid.search(query, top_k)["results"])
+        elif name == "routed":
+            from program_router import ProgramRouter
+
+            router = ProgramRouter(dense)
+            backends[name] = lambda query, vector, top_k: ids(router.search(query, vector, top_k)["results"])
+        else:
+            raise ValueError(f"unknown backend {name!r}; expected one of {BACKENDS}")
+    return backends
+
+
+def evaluate(search, queries, query_vectors, ks=DEFAULT_KS, repeat=3):
+    """Quality and latency of one backend over ``queries``.
+
+    Returns ``{"recall@k": ..., "mrr": ..., "p50_ms", "p95_ms", "p99_ms"}``.
+    MRR uses the rank of the first relevant id within the top ``max(ks)``.
+    """
+    depth = max(ks)
+    recalls = {k: [] for k in ks}
+    reciprocal_ranks = []
+    latencies = []
+    for entry in queries:
+        query, relevant = entry["query"], set(entry["relevant"])
+        vector = query_vectors[query]
+        for _ in range(repeat):
+            start = time.perf_counter()
+            ranked = search(query, vector, depth)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+        for k in ks:
+            recalls[k].append(len(relevant.intersection(ranked[:k])) / len(relevant))
+        rank = next((i for i, chunk_id in enumerate(ranked, start=1) if chunk_id in relevant), None)
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+    report = {f"recall@{k}": float(np.mean(values)) for k, values in recalls.items()}
+    report["mrr"] = float(np.mean(reciprocal_ranks))
+    for percentile in (50, 95, 99):
+        report[f"p{percentile}_ms"] = float(np.percentile(latencies, percentile))
+    return report
+
+
+def run(embed, backends=BACKENDS, queries=GOLDEN_QUERIES, ks=DEFAULT_KS, repeat=3):
+    """Build the corpus and backends with ``embed`` and evaluate each backend."""
+    chunks = list(every_chunk)
+    missing = unknown_ids(chunks, queries)
+    if missing:
+        raise ValueError(f"golden queries reference unknown chunk ids: {', '.join(missing)}")
+    embeddings = np.asarray(embed([chunk["text"] for chunk in chunks]), dtype=np.float32)
+    texts = [entry["query"] for entry in queries]
+    query_vectors = dict(zip(texts, np.asarray(embed(texts), dtype=np.float32)))
+    searches = build_backends(chunks, embeddings, query_vectors, backends)
+    return {name: evaluate(search, queries, query_vectors, ks, repeat) for name, search in searches.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrieval backends on the golden query set.")
+    parser.add_argument("--fake", action="store_true", help="use the offline FakeEmbedder")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="backend to run (repeatable; default: all)")
+    parser.add_argument("--k", type=int, action="append", help="recall cutoff (repeatable; default: 1, 3, 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per query")
+    parser.add_argument("--check", action="store_true", help="only list golden ids missing from the corpus")
+    parser.add_argument("--trace", action="store_true", help="print a per-stage timing breakdown")
+    args = parser.parse_args()
+    if args.trace:
+        enable()
+
+    if args.check:
+        missing = unknown_ids(every_chunk)
+        print("\n".join(missing) if missing else "All golden ids exist.")
+        return
+
+    from embedding_pipeline import BatchEmbedder, FakeEmbedder, OpenAIEmbedder
+
+    embed = BatchEmbedder(FakeEmbedder() if args.fake else OpenAIEmbedder())
+    ks = tuple(sorted(args.k)) if args.k else DEFAULT_KS
+    reports = run(embed, args.backend or BACKENDS, ks=ks, repeat=args.repeat)
+
+    columns = [f"recall@{k}" for k in ks] + ["mrr", "p50_ms", "p95_ms", "p99_ms"]
+    print(f"{'backend':<12}" + "".join(f"{column:>11}" for column in columns))
+    for name, report in reports.items():
+        print(f"{name:<12}" + "".join(f"{report[column]:>11.3f}" for column in columns))
+    if args.trace:
+        dump()
+
+
+if __name__ == "__main__":
+    main()
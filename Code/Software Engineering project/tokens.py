@@ -0,0 +1,47 @@
+# tokens.py
+
+"""Token counting and sentence splitting shared by the corpus build and
+retrieval stages.
+
+Uses tiktoken's cl100k_base encoding (the one text-embedding-3-small and the
+chat models use) when it is installed, otherwise a ~4 characters per token
+estimate that is close enough for batching and budgeting.
+"""
+
+import re
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+_ENCODING = tiktoken.get_encoding("cl100k_base") if tiktoken is not None else None
+
+
+def count_tokens(text):
+    """Number of tokens ``text`` occupies in a prompt or embedding request."""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return max(1, (len(text) + 3) // 4) if text else 0
+
+
+# A sentence ends at . ! or ? followed by whitespace and a capital letter,
+# except after single-letter abbreviations such as the "N." in "R.N.".
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])(?<!\b[A-Z]\.)\s+(?=[A-Z0-9\"'(\[])")
+# Abbreviations used in the course chart chunks ("Principles of Comp. Sci. I").
+_ABBREVIATIONS = frozenset(
+    "app comp dr found mr ms no org prob prog sci st stat theor var vs".split()
+)
+
+
+def split_sentences(text):
+    """Split ``text`` into sentences, keeping their terminal punctuation."""
+    sentences = []
+    for piece in _SENTENCE_END_RE.split(text.strip()):
+        if not piece:
+            continue
+        if sentences and sentences[-1].rsplit(None, 1)[-1].rstrip(".").lower() in _ABBREVIATIONS:
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
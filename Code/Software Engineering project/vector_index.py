@@ -0,0 +1,181 @@
+# vector_index.py
+
+"""In-process vector index over the chunks in data_chunks.py.
+
+Every chunk embedding lives in one contiguous float32 matrix with unit-norm
+rows, so a top-k cosine query is a single matrix-vector product followed by
+``argpartition``. Results use the same shape as ``searchContext`` in
+Backend/api_integration/pineconeClient.js (id, score, text, source, topic).
+
+With ``quantize=True`` the rows are stored as int8 codes with a per-dimension
+scale and offset, a quarter of the float32 size. The scan runs over the codes
+and the best ``top_k * rescore`` candidates are rescored exactly against the
+float32 rows, which are spilled to an unlinked temporary file and
+memory-mapped, so only the pages of rescored rows are read back.
+
+Filters resolve through a ``FacetIndex`` (see facet_index.py) to the matching
+row positions before any scoring.
+"""
+
+import tempfile
+
+import numpy as np
+
+from data_chunks import all_chunks
+from facet_index import FacetIndex
+from instrumentation import traced
+
+
+def normalize_vector(vector):
+    """``vector`` as a flat float32 array of unit length; an all-zero vector is returned as is."""
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+def _normalize_rows(matrix):
+    """Scale each row to unit length, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _quantize(matrix):
+    """Per-dimension int8 codes with ``matrix ~= offset + codes * scale``."""
+    low = matrix.min(axis=0)
+    scale = (matrix.max(axis=0) - low) / 255.0
+    scale[scale == 0] = 1.0
+    codes = np.rint((matrix - low) / scale) - 128
+    offset = low + 128 * scale
+    return np.clip(codes, -128, 127).astype(np.int8), scale.astype(np.float32), offset.astype(np.float32)
+
+
+def _spill(matrix):
+    """Copy ``matrix`` into a memory map over an anonymous temporary file."""
+    spilled = np.memmap(tempfile.TemporaryFile(), dtype=matrix.dtype, mode="w+", shape=matrix.shape)
+    spilled[:] = matrix
+    spilled.flush()
+    return spilled
+
+
+class VectorIndex:
+    """Brute-force cosine index with topic, source and chunk-set filters.
+
+    ``quantize`` stores the rows as int8 and ``rescore`` sets how many
+    candidates per requested result are rescored at full precision.
+    """
+
+    _SCAN_BLOCK = 256  # rows widened at a time; 1.5 MB of 1536-d floats stays in cache
+
+    def __init__(self, chunks, embeddings, quantize=False, rescore=4, membership=None):
+        chunks = list(chunks)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(chunks):
+            raise ValueError(
+                f"expected a ({len(chunks)}, dim) embedding matrix, got shape {matrix.shape}"
+            )
+
+        self.ids = [chunk["id"] for chunk in chunks]
+        self.texts = [chunk["text"] for chunk in chunks]
+        self.sources = [chunk.get("metadata", {}).get("source", "") for chunk in chunks]
+        self.topics = [chunk.get("metadata", {}).get("topic", "") for chunk in chunks]
+        matrix = np.ascontiguousarray(_normalize_rows(matrix), dtype=np.float32)
+        self.quantized = quantize
+        self.rescore = rescore
+        self._dimension = matrix.shape[1]
+        if quantize:
+            self.matrix = None
+            self._codes, self._scale, self._offset = _quantize(matrix)
+            self._exact = _spill(matrix)
+        else:
+            self.matrix = matrix
+
+        self.facets = FacetIndex(chunks, membership)
+
+    @classmethod
+    def from_chunks(cls, embed, chunks=None, **options):
+        """Build an index by calling ``embed(list_of_texts)`` once for the corpus."""
+        chunks = list(all_chunks if chunks is None else chunks)
+        return cls(chunks, embed([chunk["text"] for chunk in chunks]), **options)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def dimension(self):
+        return self._dimension
+
+    @property
+    def nbytes(self):
+        """Resident bytes of the vectors scanned at query time."""
+        if self.quantized:
+            return self._codes.nbytes + self._scale.nbytes + self._offset.nbytes
+        return self.matrix.nbytes
+
+    def rows(self, positions):
+        """Full-precision unit-norm embeddings of the rows at ``positions``."""
+        return np.asarray((self._exact if self.quantized else self.matrix)[positions])
+
+    def _filter_positions(self, topic=None, source=None, chunk_set=None, where=None):
+        bitmap = self.facets.select(topic=topic, source=source, chunk_set=chunk_set)
+        if where is not None:
+            bitmap = where if bitmap is None else bitmap & where
+        return None if bitmap is None else self.facets.positions(bitmap)
+
+    @traced("search.dense")
+    def search(self, query_vector, top_k=3, topic=None, source=None, chunk_set=None, where=None):
+        """Return the ``top_k`` chunks most similar to ``query_vector``.
+
+        ``topic``, ``source`` and ``chunk_set`` accept a single value or a
+        collection of values; every filter given must match. ``where`` is a
+        ``self.facets`` bitmap for anything else, e.g.
+        ``facets.match("topic", "Nursing") | facets.match("source", s)``.
+        """
+        query = normalize_vector(query_vector)
+        if query.shape[0] != self.dimension:
+            raise ValueError(f"query has dimension {query.shape[0]}, index has {self.dimension}")
+
+        positions = self._filter_positions(topic, source, chunk_set, where)
+        if not self.quantized:
+            scores = self.matrix @ query if positions is None else self.matrix[positions] @ query
+            best = self._top(scores, top_k)
+            rows = best if positions is None else positions[best]
+            return [self._result(int(row), float(score)) for row, score in zip(rows, scores[best])]
+
+        candidates = self._top(self._approximate_scores(query, positions), top_k * self.rescore)
+        if positions is not None:
+            candidates = positions[candidates]
+        candidates = np.sort(candidates)
+        scores = self._exact[candidates] @ query
+        best = self._top(scores, top_k)
+        return [self._result(int(row), float(score)) for row, score in zip(candidates[best], scores[best])]
+
+    @staticmethod
+    def _top(scores, k):
+        """Indices of the ``k`` highest ``scores``, best first."""
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        best = np.argpartition(-scores, k - 1)[:k]
+        return best[np.argsort(-scores[best])]
+
+    def _approximate_scores(self, query, positions):
+        # q . (offset + codes * scale) == q . offset + codes . (q * scale); the
+        # codes are widened one cache-sized block at a time.
+        weights = query * self._scale
+        bias = np.float32(query @ self._offset)
+        codes = self._codes if positions is None else self._codes[positions]
+        scores = np.empty(codes.shape[0], dtype=np.float32)
+        for start in range(0, codes.shape[0], self._SCAN_BLOCK):
+            block = codes[start:start + self._SCAN_BLOCK]
+            scores[start:start + block.shape[0]] = block.astype(np.float32) @ weights
+        return scores + bias
+
+    def _result(self, row, score):
+        return {
+            "id": self.ids[row],
+            "score": score,
+            "text": self.texts[row],
+            "source": self.sources[row],
+            "topic": self.topics[row],
+        }